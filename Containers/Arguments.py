@@ -16,9 +16,11 @@
 # https://www.gnu.org/licenses/.
 
 
-from typing import List, Union
-from enum import Enum, auto
-from json import dump, JSONEncoder, load
+from typing import List, Type, Union
+from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
+from json import dumps, JSONEncoder, loads
 from json.decoder import JSONDecodeError
 
 from Utility.Indexing import RunningIndex, DefaultAssumed
@@ -30,73 +32,110 @@ from Containers.Compound import Compound
 class ArgumentValues:
     """
     Collection of argument value names
+
+    Values are fixed, so that they stay valid when stored in configuration files
     """
 
     class Mode(Enum):
         """Mode of simulation"""
-        STATIC = auto()
-        DYNAMIC = auto()
-        STATIC_NO_RECOIL = auto()
+        STATIC = 1
+        DYNAMIC = 2
+        STATIC_NO_RECOIL = 3
 
     class KineticEnergy(Enum):
         """Choice of incident energy"""
-        FIXED = auto()
-        FILE = auto()
-        SWEEP = auto()
-        MAXWELLIAN_VELOCITY_DISTRIBUTION = auto()
-        MAXWELLIAN_ENERGY_DISTRIBUTION = auto()
-        FILE_ENERGY_ANGLE = auto()
-        LINEAR_RAMP = auto()
+        FIXED = 1
+        FILE = 2
+        SWEEP = 3
+        MAXWELLIAN_VELOCITY_DISTRIBUTION = 4
+        MAXWELLIAN_ENERGY_DISTRIBUTION = 5
+        FILE_ENERGY_ANGLE = 6
+        LINEAR_RAMP = 7
 
     class Angle(Enum):
         """Choice of the angle of incidence"""
-        FIXED = auto()
-        FILE = auto()
-        SWEEP = auto()
-        RANDOM_DISTRIBUTION = auto()
-        COS_DISTRIBUTION_1 = auto()
-        COS_DISTRIBUTION_2 = auto()
-        FILE_ENERGY_ANGLE = auto()
-        GAUSSIAN_2D = auto()
-        COS_2D = auto()
-        PARABOLIC_1D = auto()
+        FIXED = 1
+        FILE = 2
+        SWEEP = 3
+        RANDOM_DISTRIBUTION = 4
+        COS_DISTRIBUTION_1 = 5
+        COS_DISTRIBUTION_2 = 6
+        FILE_ENERGY_ANGLE = 7
+        GAUSSIAN_2D = 8
+        COS_2D = 9
+        PARABOLIC_1D = 10
 
     class InelasticLossModel(Enum):
         """Inelastic loss model"""
-        LINDHARD_SCHARFF = auto()
-        OEN_ROBINSON = auto()
-        LINDHARD_SCHARFF_AND_OEN_ROBINSON = auto()
-        HYDROGEN = auto()
-        HELIUM = auto()
-        ZIEGLER = auto()
-        LINDHARD_SCHARFF_AND_ZIEGLER = auto()
+        LINDHARD_SCHARFF = 1
+        OEN_ROBINSON = 2
+        LINDHARD_SCHARFF_AND_OEN_ROBINSON = 3
+        HYDROGEN = 4
+        HELIUM = 5
+        ZIEGLER = 6
+        LINDHARD_SCHARFF_AND_ZIEGLER = 7
 
     class InteractionPotential(Enum):
         """Interaction potential"""
-        KRC = auto()
-        MOLIERE = auto()
-        ZBL = auto()
-        NAKAGAWA_YAMAMURA = auto()
-        SI_SI = auto()
-        POWER = auto()
+        KRC = 1
+        MOLIERE = 2
+        ZBL = 3
+        NAKAGAWA_YAMAMURA = 4
+        SI_SI = 5
+        POWER = 6
 
     class IntegrationMethod(Enum):
         """Integration method"""
-        MAGIC = auto()
-        GAUSS_MEHLER = auto()
-        GAUSS_LEGENDRE = auto()
+        MAGIC = 1
+        GAUSS_MEHLER = 2
+        GAUSS_LEGENDRE = 3
 
     class SurfaceBindingModel(Enum):
         """Surface binding model"""
-        ELEMENT_SPECIFIC = auto()
-        AVERAGE = auto()
-        ELEMENT_PAIRS = auto()
-        SOLID_SOLID = auto()
-        SOLID_GAS = auto()
-        FILE = auto()
-        ELECTRONEGATIVITY = auto()
-        COMPOUNDS = auto()
-        TABLE = auto()
+        ELEMENT_SPECIFIC = 1
+        AVERAGE = 2
+        ELEMENT_PAIRS = 3
+        SOLID_SOLID = 4
+        SOLID_GAS = 5
+        FILE = 6
+        ELECTRONEGATIVITY = 7
+        COMPOUNDS = 8
+        TABLE = 9
+
+
+# name -> member mapping of each argument value enum, built once since Enum.__members__ creates a new mapping on every access
+ARGUMENT_VALUE_MEMBERS = {
+    cls: dict(cls.__members__) for cls in (
+        ArgumentValues.Mode,
+        ArgumentValues.KineticEnergy,
+        ArgumentValues.Angle,
+        ArgumentValues.InelasticLossModel,
+        ArgumentValues.InteractionPotential,
+        ArgumentValues.IntegrationMethod,
+        ArgumentValues.SurfaceBindingModel
+    )
+}
+
+# sentinel for attributes that are not set, since None is a valid attribute value
+MISSING = object()
+
+# shared (read-only) optional arguments of containers without optional arguments
+EMPTY_OPTIONAL = MappingProxyType({})
+
+
+def slotsToDict(obj) -> dict:
+    """
+    Returns dictionary of all attributes stored in the __slots__ of an object (in order of definition),
+    slots listed in cache_slots of the object are left out
+
+    :param obj: object with __slots__
+    """
+
+    cache_slots = getattr(obj, 'cache_slots', ())
+    return {
+        slot: getattr(obj, slot) for cls in reversed(type(obj).__mro__) for slot in getattr(cls, '__slots__', ())
+        if slot not in cache_slots
+    }
 
 
 class Arguments:
@@ -107,8 +146,13 @@ class Arguments:
     simulations.
     """
 
+    __slots__ = ('optional',)
+
+    # slots that only cache values derived from the other slots, they are not arguments
+    cache_slots = ()
+
     def __init__(self, **kwargs):
-        self.optional = kwargs
+        self.optional = kwargs if kwargs else EMPTY_OPTIONAL
 
     def get(self, argument: str):
         """
@@ -117,14 +161,19 @@ class Arguments:
         :param argument: argument name
         """
 
-        if hasattr(self, argument):
-            return getattr(self, argument)
+        if argument not in self.cache_slots:
+            value = getattr(self, argument, MISSING)
+            if value is not MISSING:
+                return value
         return self.optional.get(argument)
 
     def __str__(self) -> str:
         """Returns itself as printable string"""
 
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  optional={self.optional}'
+        attributes = slotsToDict(self)
+        attributes['optional'] = attributes.pop('optional')
+        attributes_str = '\n  '.join(f'{key}={value}' for key, value in attributes.items())
+        return f'<"{self.__class__.__name__}" object {id(self):#x}>\n  {attributes_str}'
 
 
 class GeneralBeamArguments(Arguments):
@@ -135,6 +184,8 @@ class GeneralBeamArguments(Arguments):
     :param angle_mode: choice of incidence angle
     """
 
+    __slots__ = ('kinetic_energy_mode', 'angle_mode')
+
     def __init__(
         self,
         kinetic_energy_mode: ArgumentValues.KineticEnergy = ArgumentValues.KineticEnergy.FIXED,
@@ -145,11 +196,6 @@ class GeneralBeamArguments(Arguments):
         self.kinetic_energy_mode = kinetic_energy_mode
         self.angle_mode = angle_mode
 
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  kinetic_energy_mode={self.kinetic_energy_mode}\n  angle_mode={self.angle_mode}\n  optional={self.optional}'
-
 
 class GeneralTargetArguments(Arguments):
     """
@@ -159,6 +205,8 @@ class GeneralTargetArguments(Arguments):
     :param segments: number of layers/segments of target
     """
 
+    __slots__ = ('thickness', 'segments')
+
     def __init__(
         self,
         thickness: float = 100.0,
@@ -169,11 +217,6 @@ class GeneralTargetArguments(Arguments):
         self.thickness = float(thickness)
         self.segments = int(segments)
 
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  thickness={self.thickness}\n  segments={self.segments}\n  optional={self.optional}'
-
 
 class GeneralArguments(Arguments):
     """
@@ -187,6 +230,8 @@ class GeneralArguments(Arguments):
     :param compounds: list of <Compound> containers
     """
 
+    __slots__ = ('title', 'comment', 'mode', 'fluence', 'threads', 'compounds')
+
     def __init__(
         self,
         title: str,
@@ -207,11 +252,6 @@ class GeneralArguments(Arguments):
             compounds = []
         self.compounds = compounds
 
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  title={self.title}\n  comment={self.comment}\n  mode={self.mode}\n  fluence={self.fluence}\n  threads={self.threads}\n  compounds={self.compounds}\n  optional={self.optional}'
-
 
 class RowArguments(Arguments):
     """
@@ -227,6 +267,8 @@ class RowArguments(Arguments):
     :param modified_element: if element is modified
     """
 
+    __slots__ = ('index', 'symbol', 'element', 'abundance', 'max_atomic_fraction', 'energy', 'angle')
+
     def __init__(
         self,
         index: int,
@@ -247,36 +289,6 @@ class RowArguments(Arguments):
         self.energy = float(energy)
         self.angle = float(angle)
 
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  index={self.index}\n  symbol={self.symbol}\n  element={self.element}\n  abundance={self.abundance}\n  max_atomic_fraction={self.max_atomic_fraction}\n  energy={self.energy}\n  angle={self.angle}\n  optional={self.optional}'
-
-    def __lt__(self, other):
-        """Method used only for sorting (less)"""
-
-        return self.index < other.index
-
-    def __gt__(self, other):
-        """Method used only for sorting (greater)"""
-
-        return self.index > other.index
-
-    def __le__(self, other):
-        """Method used only for sorting (less or equal)"""
-
-        return self.index <= other.index
-
-    def __ge__(self, other):
-        """Method used only for sorting (greater or equal)"""
-
-        return self.index >= other.index
-
-    def __eq__(self, other):
-        """Method used only for sorting (equal)"""
-
-        return self.index == other.index
-
 
 class StructureArguments(Arguments):
     """
@@ -288,6 +300,8 @@ class StructureArguments(Arguments):
     :param abundances: list of abundances (must sum to 1)
     """
 
+    __slots__ = ('name', 'segments', 'thickness', 'abundances')
+
     def __init__(
         self,
         name: str,
@@ -302,11 +316,6 @@ class StructureArguments(Arguments):
         self.thickness = float(thickness)
         self.abundances = abundances
 
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  name={self.name}\n  segments={self.segments}\n  thickness={self.thickness}\n  abundances={self.abundances}\n  optional={self.optional}'
-
 
 class SimulationArguments(Arguments):
     """
@@ -323,6 +332,10 @@ class SimulationArguments(Arguments):
     :param additional: list of additional arguments for input file
     """
 
+    __slots__ = ('simulation', 'title', 'beam_args', 'beam_rows', 'target_args', 'target_rows', 'structure', 'settings', 'additional', 'flat_arguments')
+
+    cache_slots = ('flat_arguments',)
+
     def __init__(
         self,
         simulation: str,
@@ -346,6 +359,29 @@ class SimulationArguments(Arguments):
         self.settings = settings
         self.additional = additional
 
+        # lookup of all arguments in sub containers, built on first access and reset by updateFlatArguments()
+        self.flat_arguments = None
+
+    def updateFlatArguments(self):
+        """Rebuilds lookup of all arguments in sub containers. Needs to be called if a sub container was modified"""
+
+        flat_arguments = {}
+        for value in slotsToDict(self).values():
+            for container in value if isinstance(value, list) else [value]:
+                if not isinstance(container, Arguments):
+                    continue
+                # attributes take precedence over optional arguments of same container
+                arguments = slotsToDict(container)
+                for key, optional_value in container.optional.items():
+                    arguments.setdefault(key, optional_value)
+                # first container with set argument takes precedence
+                for key, argument_value in arguments.items():
+                    if argument_value is not None:
+                        flat_arguments.setdefault(key, argument_value)
+        for key, optional_value in self.optional.items():
+            flat_arguments.setdefault(key, optional_value)
+        self.flat_arguments = flat_arguments
+
     def get(self, argument: str):
         """
         Returns value of argument which could be in any sub container or None if not set
@@ -353,37 +389,25 @@ class SimulationArguments(Arguments):
         :param argument: argument name
         """
 
-        if hasattr(self, argument):
-            return getattr(self, argument)
-        for key, value in self.__dict__.items():
-            if isinstance(value, list):
-                for v in value:
-                    if isinstance(v, Arguments):
-                        res = v.get(argument)
-                        if res is not None:
-                            return res
-            else:
-                if isinstance(value, Arguments):
-                    res = value.get(argument)
-                    if res is not None:
-                        return res
-        return self.optional.get(argument)
-
-    def __str__(self) -> str:
-        """Returns itself as printable string"""
-
-        return f'<"{self.__class__.__name__}" object {hex(id(self))}>\n  simulation={self.simulation}\n  beam_args={self.beam_args}\n  beam_rows={self.beam_rows}\n  target_args={self.target_args}\n  target_rows={self.target_rows}\n  structure={self.structure}\n  settings={self.settings}\n  additional={self.additional}\n  optional={self.optional}'
+        if argument not in self.cache_slots:
+            value = getattr(self, argument, MISSING)
+            if value is not MISSING:
+                return value
+        if self.flat_arguments is None:
+            self.updateFlatArguments()
+        return self.flat_arguments.get(argument)
 
 
 class ArgumentEncoderJSON(JSONEncoder):
     """Json encoder for <Arguments> classes"""
 
     def default(self, obj):
-        obj_dict = obj.__dict__
-        if obj_dict.get('optional') == {}:
-            del obj_dict['optional']
         if isinstance(obj, Enum):
-            return obj_dict.get('_name_')
+            return obj.name
+        obj_dict = obj.__dict__ if hasattr(obj, '__dict__') else slotsToDict(obj)
+        if 'optional' in obj_dict and not obj_dict['optional']:
+            # copy instead of deleting from the live object (__dict__), otherwise its "optional" attribute is lost after saving
+            obj_dict = {key: value for key, value in obj_dict.items() if key != 'optional'}
         return obj_dict
 
 
@@ -401,16 +425,18 @@ def saveSimulationArguments(arguments: SimulationArguments, file: str):
             'simulation': arguments.simulation
         },
         'beam_arguments': arguments.beam_args,
-        'beam_rows': [row for row in arguments.beam_rows],
+        'beam_rows': arguments.beam_rows,
         'target_arguments': arguments.target_args,
-        'target_rows': [row for row in arguments.target_rows],
-        'structure': [row for row in arguments.structure],
+        'target_rows': arguments.target_rows,
+        'structure': arguments.structure,
         'settings': arguments.settings,
         'additional': arguments.additional
     }
 
+    # encode in one go and write once, json.dump() would issue a write call for every single encoded chunk
+    config_str = dumps(config, indent=4, cls=ArgumentEncoderJSON)
     with open(file, 'w') as conf_file:
-        dump(config, conf_file, indent=4, cls=ArgumentEncoderJSON)
+        conf_file.write(config_str)
 
 
 def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
@@ -421,8 +447,8 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
     :return: container of <SimulationArguments> or False
     """
 
-    index = RunningIndex()
-    assumed = DefaultAssumed()
+    index: RunningIndex = RunningIndex()
+    assumed: DefaultAssumed = DefaultAssumed()
 
     def getDict(possible_dict) -> dict:
         """Returns an empty dict if possible_dict is not a dict, otherwise possible_dict is returned"""
@@ -438,43 +464,63 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
             return []
         return possible_list
 
-    def getValue(value, value_type: type, default_value, item=None, assumed_cls: DefaultAssumed = None):
-        """Returns value if value has type value_type, otherwise return default_value"""
-
-        if assumed_cls is None:
-            assumed_cls = []
-        if not isinstance(value, value_type):
-            if item is not None:
-                assumed_cls.assumed(item)
-            return default_value
-        return value
-
-    def getValueCls(value, cls, default_value, item=None, assumed_cls: DefaultAssumed = None):
-        """Returns class member with name value if is class member, otherwise return default_value"""
-
-        if assumed_cls is None:
-            assumed_cls = []
-        if not isinstance(value, str):
-            if item is not None:
-                assumed_cls.assumed(item)
-            return default_value
-        if not hasattr(cls, value):
+    def getStr(value, default_value: str, item: str = None, assumed_cls: DefaultAssumed = None) -> str:
+        """Returns value if value is a string, otherwise return default_value"""
+
+        if isinstance(value, str):
+            return value
+        if item is not None:
+            assumed_cls.assumed(item)
+        return default_value
+
+    def getInt(value, default_value: int, item: str = None, assumed_cls: DefaultAssumed = None) -> int:
+        """Returns value if value is an integer, otherwise return default_value"""
+
+        if isinstance(value, int):
+            return value
+        if item is not None:
+            assumed_cls.assumed(item)
+        return default_value
+
+    def getFloat(value, default_value: float, item: str = None, assumed_cls: DefaultAssumed = None) -> float:
+        """Returns value if value is a float, otherwise return default_value"""
+
+        if isinstance(value, float):
+            return value
+        if item is not None:
+            assumed_cls.assumed(item)
+        return default_value
+
+    def getValueCls(value, cls: Type[Enum], default_value: Enum, item: str = None, assumed_cls: DefaultAssumed = None) -> Enum:
+        """Returns class member with name (or integer value) value if is class member, otherwise return default_value"""
+
+        # look up the member name directly in the enum's name -> member mapping
+        if isinstance(value, str):
+            member = ARGUMENT_VALUE_MEMBERS[cls].get(value)
+        elif type(value) is int:
+            try:
+                member = cls(value)
+            except ValueError:
+                member = None
+        else:
+            member = None
+        if member is None:
             if item is not None:
                 assumed_cls.assumed(item)
             return default_value
-        return getattr(cls, value, default_value)
+        return member
 
     # Try to read from json file
     try:
-        with open(file, 'r') as conf_file:
-            data = load(conf_file)
-    except (FileNotFoundError, JSONDecodeError):
+        with open(file, 'rb') as conf_file:
+            data: dict = getDict(loads(conf_file.read()))
+    except (FileNotFoundError, JSONDecodeError, UnicodeDecodeError):
         return False
 
     # general data
     data_general = getDict(data.get('general'))
-    general_simulation = getValue(data_general.get('simulation'), str, 'undefined', 'simulation', assumed_cls=assumed)
-    general_title = getValue(data_general.get('title'), str, 'undefined', 'title', assumed_cls=assumed)
+    general_simulation = getStr(data_general.get('simulation'), 'undefined', 'simulation', assumed_cls=assumed)
+    general_title = getStr(data_general.get('title'), 'undefined', 'title', assumed_cls=assumed)
 
     # beam_args data (<GeneralBeamArguments>)
     data_beam_args = getDict(data.get('beam_arguments'))
@@ -488,20 +534,24 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
     # target_args data (<GeneralTargetArguments>)
     data_target_args = getDict(data.get('target_arguments'))
     target_args_parameters = {
-        'thickness': getValue(data_target_args.get('thickness'), float, 2000.0, 'thickness', assumed_cls=assumed),
-        'segments': getValue(data_target_args.get('segments'), int, 200, 'segments', assumed_cls=assumed)
+        'thickness': getFloat(data_target_args.get('thickness'), 2000.0, 'thickness', assumed_cls=assumed),
+        'segments': getInt(data_target_args.get('segments'), 200, 'segments', assumed_cls=assumed)
     }
     target_args_parameters.update(getDict(data_target_args.get('optional')))
     target_args = GeneralTargetArguments(**target_args_parameters)
 
-    def rowList(rows_list: dict, typ: str) -> List[RowArguments]:
+    def rowList(rows_list: list, typ: str) -> List[RowArguments]:
         """Converts the rows_list into a list of <RowArguments>"""
 
-        rows_list = getList(rows_list)
-        rows = []
-        for row_dict in [getDict(i) for i in rows_list]:
+        rows: List[RowArguments] = []
+        for row_dict in getList(rows_list):
             # only accept rows with set symbols
-            if not isinstance(row_dict.get('symbol'), str) or not isinstance(row_dict.get('element'), dict) or row_dict.get('element').get('symbol') is None:
+            if not isinstance(row_dict, dict):
+                assumed.assumed(f'{typ} row not convertible')
+                continue
+            symbol = row_dict.get('symbol')
+            element_dict = row_dict.get('element')
+            if not isinstance(symbol, str) or not isinstance(element_dict, dict) or element_dict.get('symbol') is None:
                 assumed.assumed(f'{typ} row not convertible')
                 continue
             assumed_row = DefaultAssumed()
@@ -510,15 +560,15 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
                 row_index = 999
             row_parameters = {
                 'index': row_index,
-                'symbol': row_dict.get('symbol'),
-                'element': Element(**getDict(row_dict.get('element'))),
-                'abundance': getValue(row_dict.get('abundance'), float, 1.0, 'abundance', assumed_cls=assumed_row),
-                'max_atomic_fraction': getValue(row_dict.get('max_atomic_fraction'), float, 1.0, 'max_atomic_fraction', assumed_cls=assumed_row)
+                'symbol': symbol,
+                'element': Element.fromDict(element_dict),
+                'abundance': getFloat(row_dict.get('abundance'), 1.0, 'abundance', assumed_cls=assumed_row),
+                'max_atomic_fraction': getFloat(row_dict.get('max_atomic_fraction'), 1.0, 'max_atomic_fraction', assumed_cls=assumed_row)
             }
             if typ == 'beam':
                 row_parameters.update({
-                    'energy': getValue(row_dict.get('energy'), float, 0.0, 'energy', assumed_cls=assumed_row),
-                    'angle': getValue(row_dict.get('angle'), float, 0.0, 'angle', assumed_cls=assumed_row)
+                    'energy': getFloat(row_dict.get('energy'), 0.0, 'energy', assumed_cls=assumed_row),
+                    'angle': getFloat(row_dict.get('angle'), 0.0, 'angle', assumed_cls=assumed_row)
                 })
             optional = getDict(row_dict.get('optional'))
             if optional.get('inelastic_loss_model') is not None:
@@ -537,17 +587,18 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
     target_rows = rowList(data.get('target_rows'), 'target')
 
     # force row indices are continuous and in order
-    for _, row in sorted(zip([row.index for row in beam_rows + target_rows], beam_rows + target_rows)):
+    for row in sorted(beam_rows + target_rows, key=attrgetter('index')):
         row.index = index.get()
 
     # structure data (List[<StructureArguments>])
     structure_list = getList(data.get('structure'))
-    structure = []
-    for structure_dict in [getDict(i) for i in structure_list]:
+    structure: List[StructureArguments] = []
+    for structure_dict in structure_list:
+        structure_dict = getDict(structure_dict)
         structure_parameters = {
-            'name': getValue(structure_dict.get('name'), str, 'Layer', 'layer_name', assumed_cls=assumed),
-            'segments': getValue(structure_dict.get('segments'), int, 200, 'layer_segments', assumed_cls=assumed),
-            'thickness': getValue(structure_dict.get('thickness'), float, 2000.0, 'layer_thickness', assumed_cls=assumed),
+            'name': getStr(structure_dict.get('name'), 'Layer', 'layer_name', assumed_cls=assumed),
+            'segments': getInt(structure_dict.get('segments'), 200, 'layer_segments', assumed_cls=assumed),
+            'thickness': getFloat(structure_dict.get('thickness'), 2000.0, 'layer_thickness', assumed_cls=assumed),
             'abundances': getList(structure_dict.get('abundances'))
         }
         structure_parameters.update(getDict(structure_dict.get('optional')))
@@ -570,12 +621,12 @@ def loadSimulationArguments(file: str) -> Union[bool, SimulationArguments]:
     # settings data (<GeneralArguments>)
     data_settings = getDict(data.get('settings'))
     settings_parameters = {
-        'title': getValue(data_settings.get('title'), str, general_title, 'title', assumed_cls=assumed),
-        'comment': getValue(data_settings.get('comment'), str, '', 'comment', assumed_cls=assumed),
+        'title': getStr(data_settings.get('title'), general_title, 'title', assumed_cls=assumed),
+        'comment': getStr(data_settings.get('comment'), '', 'comment', assumed_cls=assumed),
         'mode': getValueCls(data_settings.get('mode'), ArgumentValues.Mode, ArgumentValues.Mode.STATIC, 'mode', assumed_cls=assumed),
-        'fluence': getValue(data_settings.get('fluence'), float, 1.0, 'fluence', assumed_cls=assumed),
-        'threads': getValue(data_settings.get('threads'), int, 0, 'threads', assumed_cls=assumed),
-        'compounds': [Compound(**getDict(compound)) for compound in getList(data_settings.get('compounds'))]
+        'fluence': getFloat(data_settings.get('fluence'), 1.0, 'fluence', assumed_cls=assumed),
+        'threads': getInt(data_settings.get('threads'), 0, 'threads', assumed_cls=assumed),
+        'compounds': [Compound.fromDict(getDict(compound)) for compound in getList(data_settings.get('compounds'))]
     }
     optional_settings = data_settings.get('optional')
     if isinstance(optional_settings, dict):
@@ -15,8 +15,9 @@
 # You should have received a copy of the GNU General Public License along with this program. If not, see
 # https://www.gnu.org/licenses/.
 
-from typing import Dict, List
-from Containers.Element import Element
+from __future__ import annotations
+from typing import Dict, Set
+from sys import intern
 
 
 class Compound:
@@ -28,22 +29,30 @@ class Compound:
     :param name_save: compound name used in input file
     """
 
+    __slots__ = ('name', 'elements', 'name_save')
+
     def __init__(self, name: str = None, elements: Dict[str, int] = None, name_save: str = None):
 
         if name_save is None:
             name_save = name
 
+        # intern element symbols, so they can be compared by identity when hashed
+        if isinstance(elements, dict):
+            elements = {intern(element): amount for element, amount in elements.items()}
+
         # generate name if necessary
         if name is None:
-            name = ''
-            name_save = ''
+            name_parts = []
+            name_save_parts = []
             if isinstance(elements, dict):
                 for element, amount in elements.items():
-                    name += element
-                    name_save += element
+                    name_parts.append(element)
+                    name_save_parts.append(element)
                     if amount > 1:
-                        name += f'<sub>{amount}</sub>'
-                        name_save += str(amount)
+                        name_parts.append(f'<sub>{amount}</sub>')
+                        name_save_parts.append(str(amount))
+            name = ''.join(name_parts)
+            name_save = ''.join(name_save_parts)
         if not name:
             name = '???'
             name_save = '???'
@@ -52,19 +61,33 @@ class Compound:
         self.elements: Dict = elements
         self.name_save = name_save
 
+    @staticmethod
+    def fromDict(dictionary: dict) -> Compound:
+        """
+        Returns <Compound> created from dictionary (e.g. from a save file), keys that are no parameters are ignored
+
+        :param dictionary: dictionary with parameters of compound
+        """
+
+        return Compound(
+            name=dictionary.get('name'),
+            elements=dictionary.get('elements'),
+            name_save=dictionary.get('name_save')
+        )
+
     def __str__(self) -> str:
         """Returns the string interpretation of the compound"""
 
         return self.name_save
 
-    def matches(self, elements: List[Element] = None) -> bool:
+    def matches(self, symbols: Set[str] = None) -> bool:
         """
-        Check if elements of compound are in list of provided elements
+        Check if elements of compound are in set of provided element symbols
 
-        :param elements: list of provided <Element> containers that should be checked against elements on compound
+        :param symbols: set of provided element symbols (e.g.: H, Ar, ...) that should be checked against elements of compound
         """
 
-        if self.elements is None or elements is None:
+        if self.elements is None or symbols is None:
             return False
 
-        return all(element in [element.symbol for element in elements] for element in self.elements.keys())
+        return self.elements.keys() <= symbols
@@ -17,7 +17,10 @@
 
 
 from __future__ import annotations
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
+from sys import intern
+
+import numpy as np
 
 
 class Element:
@@ -49,6 +52,16 @@ class Element:
     :param copy_original: (optional) if element should have a copy of its original form
     """
 
+    __slots__ = (
+        'symbol', 'name', 'atomic_nr', 'period', 'group', 'atomic_mass', 'atomic_density',
+        'periodic_table_symbol', 'mass_density', 'surface_binding_energy', 'displacement_energy', 'cutoff_energy',
+        'dissociation_heat', 'melt_enthalpy', 'vaporization_energy', 'formation_enthalpy',
+        'modified', 'original'
+    )
+
+    # format spec -> languages, shared by all elements
+    format_languages: Dict[str, Tuple[str, ...]] = {}
+
     def __init__(
         self,
         symbol: str = None,
@@ -84,7 +97,7 @@ class Element:
             atomic_density = 0
 
         # Required arguments
-        self.symbol = str(symbol)
+        self.symbol = intern(str(symbol))
         self.name = name  # should be dict
         if isinstance(self.name, str):
             self.name = {
@@ -97,7 +110,7 @@ class Element:
         self.atomic_density = float(atomic_density)
 
         # Optional arguments
-        self.periodic_table_symbol = str(periodic_table_symbol)
+        self.periodic_table_symbol = intern(str(periodic_table_symbol))
         if not periodic_table_symbol:
             self.periodic_table_symbol = self.symbol
         self.mass_density = mass_density
@@ -122,27 +135,46 @@ class Element:
         :param copy_original: if there should be a copy of the original element
         """
 
+        # attributes are already converted, so they are copied without going through __init__ again
+        element = Element.__new__(Element)
+        for slot in self.__slots__:
+            setattr(element, slot, getattr(self, slot))
+        element.modified = False
+        element.original = None
+        if copy_original:
+            element.original = element.copy(copy_original=False)
+        return element
+
+    @staticmethod
+    def fromDict(dictionary: dict) -> Element:
+        """
+        Returns <Element> created from dictionary (e.g. from a save file), keys that are no parameters are ignored
+
+        :param dictionary: dictionary with parameters of element
+        """
+
+        get = dictionary.get
         return Element(
-            symbol=self.symbol,
-            name=self.name,
-            atomic_nr=self.atomic_nr,
-            period=self.period,
-            group=self.group,
-            atomic_mass=self.atomic_mass,
-            atomic_density=self.atomic_density,
-
-            periodic_table_symbol=self.periodic_table_symbol,
-            mass_density=self.mass_density,
-            surface_binding_energy=self.surface_binding_energy,
-            displacement_energy=self.displacement_energy,
-            cutoff_energy=self.cutoff_energy,
-            dissociation_heat=self.dissociation_heat,
-            melt_enthalpy=self.melt_enthalpy,
-            vaporization_energy=self.vaporization_energy,
-            formation_enthalpy=self.formation_enthalpy,
-
-            modified=False,
-            copy_original=copy_original
+            symbol=get('symbol'),
+            name=get('name'),
+            atomic_nr=get('atomic_nr'),
+            period=get('period'),
+            group=get('group'),
+            atomic_mass=get('atomic_mass'),
+            atomic_density=get('atomic_density'),
+
+            periodic_table_symbol=get('periodic_table_symbol', ''),
+            mass_density=get('mass_density'),
+            surface_binding_energy=get('surface_binding_energy'),
+            displacement_energy=get('displacement_energy'),
+            cutoff_energy=get('cutoff_energy'),
+            dissociation_heat=get('dissociation_heat'),
+            melt_enthalpy=get('melt_enthalpy'),
+            vaporization_energy=get('vaporization_energy'),
+            formation_enthalpy=get('formation_enthalpy'),
+
+            modified=get('modified', False),
+            copy_original=get('copy_original', True)
         )
 
     def getOriginal(self) -> Union[Element, None]:
@@ -162,7 +194,7 @@ class Element:
     def __str__(self) -> str:
         """Returns name of element in english"""
 
-        return self.__format__('en')
+        return self.name.get('en')
 
     def __format__(self, spec: str) -> str:
         """
@@ -171,25 +203,14 @@ class Element:
         :param spec: can be one language(e.g. 'en', 'de') or multiple languages separated by '|' (e.g. 'en|de')
         """
 
-        name = self.name.get('en')
-        if '|' in spec:
-            spec = spec.split('|')
+        languages = self.format_languages.get(spec)
+        if languages is None:
+            languages = self.format_languages[spec] = tuple(map(intern, spec.split('|')))
 
-        if isinstance(spec, str):
-            name_spec = self.name.get(spec)
-            if name_spec:
-                name = name_spec
-
-        elif isinstance(spec, list):
-            names_spec = []
-            for sp in spec:
-                name_spec = self.name.get(str(sp))
-                if name_spec:
-                    names_spec.append(name_spec)
-            if len(names_spec):
-                name = '/'.join(names_spec)
-
-        return name
+        names_spec = [name_spec for name_spec in map(self.name.get, languages) if name_spec]
+        if names_spec:
+            return '/'.join(names_spec)
+        return self.name.get('en')
 
 
 class Elements:
@@ -201,6 +222,27 @@ class Elements:
 
     def __init__(self, elements: List[Element]):
         self.elements = elements
+        self.elements_by_symbol: Dict[str, Element] = {}
+        self.elements_by_nr: Dict[int, List[Element]] = {}
+        self.elements_search: List[Tuple[Element, str]] = []
+        self.symbol_positions: Dict[str, int] = {}
+        self.atomic_masses = np.array([], dtype=float)
+        self.indexElements()
+
+    def indexElements(self):
+        """Builds lookup tables of the internal element list by symbol and by atomic number, the lowercase search texts and the array of atomic masses"""
+
+        self.elements_by_symbol = {}
+        self.elements_by_nr = {}
+        self.elements_search = []
+        self.symbol_positions = {}
+        for position, element in enumerate(self.elements):
+            # first element with a symbol is used for lookups by symbol
+            self.elements_by_symbol.setdefault(element.symbol, element)
+            self.symbol_positions.setdefault(element.symbol, position)
+            self.elements_by_nr.setdefault(element.atomic_nr, []).append(element)
+            self.elements_search.append((element, '|'.join([element.symbol, *element.name.values()]).lower()))
+        self.atomic_masses = np.array([element.atomic_mass for element in self.elements], dtype=float)
 
     def updateElements(self, elements: Union[List[Element], bool]) -> bool:
         """
@@ -211,10 +253,26 @@ class Elements:
 
         if not elements:
             self.elements = []
+            self.indexElements()
             return False
         self.elements = elements
+        self.indexElements()
         return True
 
+    @staticmethod
+    def copyElement(element: Element) -> Element:
+        """
+        Returns copy of stored element, the copy shares the (not modified) original of the stored element
+
+        :param element: stored element
+        """
+
+        if element.original is None:
+            return element.copy()
+        element_copy = element.copy(copy_original=False)
+        element_copy.original = element.original
+        return element_copy
+
     def elementFromNr(self, atomic_nr: int) -> Union[Element, None]:
         """
         Get element from atomic number
@@ -222,10 +280,10 @@ class Elements:
         :param atomic_nr: desired element atomic number
         """
 
-        for element in self.elements:
-            if element.atomic_nr == atomic_nr:
-                return element.copy()
-        return None
+        isotopes = self.elements_by_nr.get(atomic_nr)
+        if not isotopes:
+            return None
+        return self.copyElement(isotopes[0])
 
     def elementFromSymbol(self, symbol: str) -> Union[Element, None]:
         """
@@ -234,10 +292,10 @@ class Elements:
         :param symbol: desired element symbol
         """
 
-        for element in self.elements:
-            if element.symbol == symbol:
-                return element.copy()
-        return None
+        element = self.elements_by_symbol.get(symbol)
+        if element is None:
+            return None
+        return self.copyElement(element)
 
     def getIsotopes(self, atomic_nr: int) -> List[Element]:
         """
@@ -246,7 +304,7 @@ class Elements:
         :param atomic_nr: desired atomic number
         """
 
-        return [element.copy() for element in self.elements if element.atomic_nr == atomic_nr]
+        return [self.copyElement(element) for element in self.elements_by_nr.get(atomic_nr, [])]
 
     def elementsMatching(self, text: str) -> List[Element]:
         """
@@ -256,13 +314,16 @@ class Elements:
         """
 
         text = str.lower(text)
-        results = []
-        for element in self.elements:
-            symbol = str.lower(element.symbol)
-            name = '|'.join(element.name.values()).lower()
-            if text in symbol or text in name:
-                results.append(element.copy())
-        return results
+        return [self.copyElement(element) for element, search_text in self.elements_search if text in search_text]
+
+    def atomicMasses(self, symbols: List[str]) -> np.ndarray:
+        """
+        Get array of atomic masses for symbols
+
+        :param symbols: desired element symbols
+        """
+
+        return self.atomic_masses[[self.symbol_positions[symbol] for symbol in symbols]]
 
     def checkIfDefault(self, element: Element, attribute: str) -> bool:
         """
@@ -272,14 +333,9 @@ class Elements:
         :param attribute: desired attribute
         """
 
-        symbol = element.symbol
-        orig_element = self.elementFromSymbol(symbol)
-        if orig_element is None:
+        # no copy needed, the original element is only read
+        orig_element = self.elements_by_symbol.get(element.symbol)
+        if orig_element is None or attribute not in Element.__slots__:
             return False
-        if not hasattr(element, attribute) or not hasattr(orig_element, attribute):
-            return False
-        value = getattr(element, attribute)
-        orig_value = getattr(orig_element, attribute)
-        if value is not orig_value:
-            return False
-        return True
+        # values are compared by equality, since equal floats are usually not the same object
+        return getattr(element, attribute) == getattr(orig_element, attribute)
@@ -18,9 +18,10 @@
 
 from typing import List
 
-from Utility.Functions import normalizeList
+import numpy as np
 
 from Containers.Element import Element
+from Utility.Functions import normalizeArray
 
 
 class GlobalDensity:
@@ -28,7 +29,7 @@ class GlobalDensity:
     Class that calculates the global density for given elements and abundances
 
     :param elements: (optional) list of elements
-    :param abundances: (optional) list of abundances
+    :param abundances: (optional) list or array of abundances
     :param density: (optional) desired global density (g / cm^3)
     :param density_in_amu: (optional) if density is provided in (amu / A^3)
     """
@@ -43,7 +44,8 @@ class GlobalDensity:
 
         if abundances is None:
             abundances = []
-        self.abundances = abundances
+        self.abundances = np.asarray(abundances, dtype=float)
+        self.normalized_abundances = None
 
         self.adaptArrays()
         self.density = density
@@ -66,7 +68,8 @@ class GlobalDensity:
         :param abundances: List of abundances
         """
 
-        self.abundances = abundances
+        # always copied, so the normalized array that was handed out is not mistaken for unchanged abundances
+        self.abundances = np.array(abundances, dtype=float)
         self.adaptArrays()
 
     def updateDensity(self, density: float, density_in_amu: bool = False):
@@ -81,20 +84,25 @@ class GlobalDensity:
         self.density_in_amu = density_in_amu
 
     def adaptArrays(self):
-        """Adapts length of abundances to length of elements and sums it to 1"""
+        """Adapts length of abundances to length of elements and sums it to 1 (rounded to 5 digits)"""
 
         difference = len(self.elements) - len(self.abundances)
-        if difference:
-            if difference < 0:
-                self.abundances = self.abundances[:len(self.elements)]
-            else:
-                self.abundances.extend([0] * difference)
-        self.abundances = normalizeList(self.abundances)
+        if difference < 0:
+            self.abundances = self.abundances[:len(self.elements)]
+        elif difference > 0:
+            self.abundances = np.concatenate((self.abundances, np.zeros(difference)))
+
+        # abundances are only normalized again if they changed (not if only the elements were updated)
+        if difference or self.abundances is not self.normalized_abundances:
+            self.abundances = self.normalized_abundances = normalizeArray(self.abundances)
+
+        # array for the mean amu, so it is not recalculated element by element for each density change
+        self.atomic_masses = np.fromiter((element.atomic_mass for element in self.elements), dtype=float, count=len(self.elements))
 
     def meanAmu(self) -> float:
         """Returns mean amu per atom of elements"""
 
-        return sum([element.atomic_mass * abundance for (element, abundance) in zip(self.elements, self.abundances)])
+        return float(np.dot(self.atomic_masses, self.abundances))
 
     def atomicDensity(self, density: float = None, density_in_amu: bool = None) -> float:
         """
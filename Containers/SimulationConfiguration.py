@@ -17,14 +17,14 @@
 
 
 from __future__ import annotations
-from typing import Union, TYPE_CHECKING
+from typing import Union, List, Callable, TYPE_CHECKING
 from os import path
 
 from Simulations.SimulationsList import SimulationsList
 
 # avoiding circular import, but still get type hinting functionality
 if TYPE_CHECKING:
-    from Pages.ProgramPage import SimulationPage
+    from Pages.ProgramPage import LazySimulationPage
 
 
 class SimulationConfiguration:
@@ -40,10 +40,13 @@ class SimulationConfiguration:
     :param save_folder: (optional) specific save folder
     """
 
+    # list of simulations, only looked up once
+    simulations_list: Union[SimulationsList, None] = None
+
     def __init__(self, title: str, program: int, folder: str, binary: str,
                  version: str = 'unknown', base_save_folder: str = '', save_folder: str = ''):
         # Get list of simulations
-        sim_list = SimulationsList()
+        sim_list = SimulationConfiguration.getSimulationsList()
         assert(program in range(len(sim_list.simulation_program_list)))
 
         self.title = title
@@ -56,7 +59,8 @@ class SimulationConfiguration:
         self.folder = folder
         self.binary = binary
         self.version = version
-        self.tab_widget: Union[SimulationPage, None] = None
+        self.tab_widget: Union[LazySimulationPage, None] = None
+        self.tab_title = ''
         self.changed = True
         self.has_settings = False
         self.running = False
@@ -65,6 +69,14 @@ class SimulationConfiguration:
         self.base_save_folder = base_save_folder
         self.save_folder = save_folder
 
+    @staticmethod
+    def getSimulationsList() -> SimulationsList:
+        """Returns the list of simulations"""
+
+        if SimulationConfiguration.simulations_list is None:
+            SimulationConfiguration.simulations_list = SimulationsList()
+        return SimulationConfiguration.simulations_list
+
     def edit(self, title: str, folder: str, binary: str, version: str, base_save_folder: str):
         """
         Sets main parameters of simulation
@@ -106,12 +118,16 @@ class SimulationConfiguration:
 
         return save_dict
 
+    # settings that store paths
+    path_settings = ['folder', 'binary', 'base_save_folder', 'save_folder']
+
     @staticmethod
-    def load(settings: dict) -> Union[SimulationConfiguration, bool]:
+    def load(settings: dict, path_exists: Callable[[str], bool] = path.exists) -> Union[SimulationConfiguration, bool]:
         """
         Returns a SimulationConfiguration from the settings-dictionary that is created by save() or False if not possible
 
         :param settings: dictionary with settings
+        :param path_exists: (optional) function that returns if a path exists
         """
 
         program = settings.get('program')
@@ -119,19 +135,16 @@ class SimulationConfiguration:
         if not isinstance(program, str) or not isinstance(title, str):
             return False
 
-        if program not in SimulationsList().simulation_program_names:
-            return False
-
-        program_idx = SimulationsList().simulation_program_names.index(program)
-        if program_idx < 0:
+        program_idx = SimulationConfiguration.getSimulationsList().simulation_program_indices.get(program)
+        if program_idx is None:
             return False
 
         folder = settings.get('folder')
-        if not isinstance(folder, str) or not path.exists(folder):
+        if not isinstance(folder, str) or not path_exists(folder):
             return False
 
         binary = settings.get('binary')
-        if not isinstance(binary, str) or not path.exists(binary):
+        if not isinstance(binary, str) or not path_exists(binary):
             return False
 
         version = settings.get('version')
@@ -139,11 +152,11 @@ class SimulationConfiguration:
             version = 'unknown'
 
         base_save_folder = settings.get('base_save_folder')
-        if not isinstance(base_save_folder, str) or not path.exists(base_save_folder):
+        if not isinstance(base_save_folder, str) or not path_exists(base_save_folder):
             base_save_folder = ''
 
         save_folder = settings.get('save_folder')
-        if not isinstance(save_folder, str) or not path.exists(save_folder):
+        if not isinstance(save_folder, str) or not path_exists(save_folder):
             save_folder = ''
 
         sc = SimulationConfiguration(title, program_idx, folder, binary, version)
@@ -151,3 +164,20 @@ class SimulationConfiguration:
         sc.save_folder = save_folder
 
         return sc
+
+    @staticmethod
+    def loadList(settings_list: list) -> List[Union[SimulationConfiguration, bool]]:
+        """
+        Returns a list of SimulationConfiguration (or False if not possible) from a list of settings-dictionaries.
+        Each path is only checked once.
+
+        :param settings_list: list of dictionaries with settings
+        """
+
+        paths = {
+            settings.get(key) for settings in settings_list if isinstance(settings, dict)
+            for key in SimulationConfiguration.path_settings if isinstance(settings.get(key), str)
+        }
+        existing_paths = {check_path: path.exists(check_path) for check_path in paths}
+
+        return [SimulationConfiguration.load(settings, existing_paths.get) for settings in settings_list]
@@ -16,16 +16,19 @@
 # https://www.gnu.org/licenses/.
 
 
+from typing import Union
+
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QDialog, QGridLayout, QVBoxLayout, QHBoxLayout, QLabel, QStackedWidget, QComboBox,
     QLineEdit, QWidget, QDialogButtonBox, QCheckBox, QPushButton, QFileDialog
 )
-from PyQt5.QtGui import QPixmap
 
 from GlobalConf import GlobalConf
 
-from Simulations.SimulationsList import SimulationsList
+from Containers.SimulationConfiguration import SimulationConfiguration
+
+from Utility.ModifyWidget import scaledPixmap
 
 
 class ManualDialog(QDialog):
@@ -44,19 +47,21 @@ class ManualDialog(QDialog):
 
         name = 'Add a new configuration'
 
+        manual = (
+            '1) Open the <b>Configurations</b> tab<br>'
+            '2) Select <b>Add new configuration</b> from the <i>List of Simulation Configurations</i><br>'
+            '3) Provide a title in the <b>Configuration title</b> field<br>'
+            '4) Select a program from the <b>Simulation program</b> list<br>'
+            '5) Select the <b>Simulation folder</b> by clicking on the button with three dots<br>'
+            '6) Select the <b>Simulation binary</b> by clicking on the button with three dots<br>'
+            '7) Check if the <b>Detected simulation</b> matches the desired simulation<br>'
+            '8) Confirm the newly added configuration by pressing <b>Save configuration</b>'
+        )
+
         def __init__(self, parent):
             super().__init__(parent)
-            manual = (
-                '1) Open the <b>Configurations</b> tab<br>' +
-                '2) Select <b>Add new configuration</b> from the <i>List of Simulation Configurations</i><br>' +
-                '3) Provide a title in the <b>Configuration title</b> field<br>' +
-                '4) Select a program from the <b>Simulation program</b> list<br>' +
-                '5) Select the <b>Simulation folder</b> by clicking on the button with three dots<br>' +
-                '6) Select the <b>Simulation binary</b> by clicking on the button with three dots<br>' +
-                '7) Check if the <b>Detected simulation</b> matches the desired simulation<br>'
-                '8) Confirm the newly added configuration by pressing <b>Save configuration</b>'
-            )
-            self.setText(manual)
+            self.setTextFormat(Qt.RichText)
+            self.setText(self.manual)
 
     class ManualEditSimulation(QLabel):
         """
@@ -67,15 +72,17 @@ class ManualDialog(QDialog):
 
         name = 'Edit an existing configuration'
 
+        manual = (
+            '1) Open the <b>Configurations</b> tab<br>'
+            '2) Select the simulation in the <b>List of Simulation Configurations</b><br>'
+            '3) Make the changes in the <b>Simulation Configuration</b><br>'
+            '4) Confirm the edited configuration by pressing <b>Save configuration</b>'
+        )
+
         def __init__(self, parent):
             super().__init__(parent)
-            manual = (
-                '1) Open the <b>Configurations</b> tab<br>' +
-                '2) Select the simulation in the <b>List of Simulation Configurations</b><br>' +
-                '3) Make the changes in the <b>Simulation Configuration</b><br>'
-                '4) Confirm the edited configuration by pressing <b>Save configuration</b>'
-            )
-            self.setText(manual)
+            self.setTextFormat(Qt.RichText)
+            self.setText(self.manual)
 
     class ManualImportSimulation(QWidget):
         """
@@ -90,35 +97,52 @@ class ManualDialog(QDialog):
             super().__init__(parent)
             icon_size = 30
             self.layout = QVBoxLayout()
-            self.layout.addWidget(QLabel(
-                'Example: Convert input file for simulation X into input file for simulation Y:<br><br>' +
-                '1) Create configurations with the simulation programs X and Y<br>' +
-                '2) Open the input file in simulation X'
+            self.layout.addWidget(self.textLabel(
+                'Example: Convert input file for simulation X into input file for simulation Y:<br><br>'
+                '1) Create configurations with the simulation programs X and Y<br>'
+                '2) Open the input file in simulation X',
+                Qt.RichText
             ))
             label_open = QLabel('', self)
-            label_open.setPixmap(QPixmap(':/icons/open.png').scaled(icon_size, icon_size, transformMode=Qt.SmoothTransformation))
+            label_open.setPixmap(scaledPixmap(':/icons/open.png', icon_size, icon_size, Qt.FastTransformation))
             self.layout.addWidget(label_open)
-            self.layout.addWidget(QLabel(
-                '3) Save the simulation X'
+            self.layout.addWidget(self.textLabel(
+                '3) Save the simulation X',
+                Qt.PlainText
             ))
             label_save = QLabel('', self)
-            label_save.setPixmap(QPixmap(':/icons/save.png').scaled(icon_size, icon_size, transformMode=Qt.SmoothTransformation))
+            label_save.setPixmap(scaledPixmap(':/icons/save.png', icon_size, icon_size, Qt.FastTransformation))
             self.layout.addWidget(label_save)
-            self.layout.addWidget(QLabel(
-                '4) Change to simulation Y and click the convert button'
+            self.layout.addWidget(self.textLabel(
+                '4) Change to simulation Y and click the convert button',
+                Qt.PlainText
             ))
             label_import = QLabel('', self)
-            label_import.setPixmap(QPixmap(':/icons/convert.png').scaled(icon_size, icon_size, transformMode=Qt.SmoothTransformation))
+            label_import.setPixmap(scaledPixmap(':/icons/convert.png', icon_size, icon_size, Qt.FastTransformation))
             self.layout.addWidget(label_import)
-            self.layout.addWidget(QLabel(
-                '5) Navigate to the folder, where simulation X was saved and select the <b>input.json</b> file<br>' +
-                '6) Select a folder where simulation Y will be saved<br>' +
-                '7) Not convertable input parameter are highlighted red in simulation Y<br>' +
-                '8) Adjust highlighted parameters and save the simulation Y'
+            self.layout.addWidget(self.textLabel(
+                '5) Navigate to the folder, where simulation X was saved and select the <b>input.json</b> file<br>'
+                '6) Select a folder where simulation Y will be saved<br>'
+                '7) Not convertable input parameter are highlighted red in simulation Y<br>'
+                '8) Adjust highlighted parameters and save the simulation Y',
+                Qt.RichText
             ))
 
             self.setLayout(self.layout)
 
+        def textLabel(self, text: str, text_format: Qt.TextFormat) -> QLabel:
+            """
+            Returns label with text of given format, so the format does not need to be detected
+
+            :param text: text of label
+            :param text_format: format of text
+            """
+
+            label = QLabel(self)
+            label.setTextFormat(text_format)
+            label.setText(text)
+            return label
+
     manualWidgetList = [ManualImportSimulation, ManualAddSimulation, ManualEditSimulation]
 
     def __init__(self, parent):
@@ -137,7 +161,7 @@ class ManualDialog(QDialog):
         self.layout_manual_selector.addWidget(QLabel('Show manual for:'))
         self.manual_selector = QComboBox()
         self.layout_manual_selector.addWidget(self.manual_selector)
-        self.manual_selector.currentIndexChanged.connect(lambda i: self.stack.setCurrentIndex(i))
+        self.manual_selector.currentIndexChanged.connect(self.showManual)
         self.layout.addLayout(self.layout_manual_selector)
 
         # stack of widgets
@@ -147,18 +171,33 @@ class ManualDialog(QDialog):
         self.layout.addStretch()
         self.setLayout(self.layout)
 
+        # manual widgets are only created when they are shown the first time
+        self.manual_created = [False] * len(self.manualWidgetList)
+
         for manual in self.manualWidgetList:
             manual_name = 'NAME MISSING'
             if hasattr(manual, 'name'):
                 manual_name = manual.name
+            self.stack.addWidget(QWidget(self.stack))
             self.manual_selector.addItem(manual_name)
 
-            parent = QWidget()
-            parent_layout = QVBoxLayout()
-            parent_layout.addWidget(manual(self.parent_widget))
+    def showManual(self, index: int):
+        """
+        Shows manual widget, creates it if it is shown the first time
+
+        :param index: index of manual widget
+        """
+
+        if index < 0:
+            return
+
+        if not self.manual_created[index]:
+            self.manual_created[index] = True
+            parent_layout = QVBoxLayout(self.stack.widget(index))
+            parent_layout.addWidget(self.manualWidgetList[index](self.parent_widget))
             parent_layout.addStretch()
-            parent.setLayout(parent_layout)
-            self.stack.addWidget(parent)
+
+        self.stack.setCurrentIndex(index)
 
 
 class PreferencesDialog(QDialog):
@@ -168,6 +207,22 @@ class PreferencesDialog(QDialog):
     :param parent: parent widget
     """
 
+    # (name in GlobalConf, text) of checkboxes for boolean preferences
+    preference_checkboxes = [
+        # default element table warning
+        ('skip_element_info', 'Skip the element table warning when the used simulation does not provide used element data'),
+        # file deletion warning
+        ('skip_delete_info', 'Skip the file deletion warning when running a simulation'),
+        # load closed configurations
+        ('keep_configurations_info', 'Keep configurations in all simulation tabs when open GUI again'),
+        # open in multiple tabs warning (not needed)
+        # ('skip_open_multiple_info', 'Skip the information, that opening a configuration in all tabs will create multiple copies'),
+        # element language
+        ('use_default_language', 'Use system language for elements (if supported by simulation)'),
+        # simulation detection warning
+        ('no_autodetect_version', 'Do not warn if other simulation was detected than selected')
+    ]
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -191,40 +246,19 @@ class PreferencesDialog(QDialog):
         self.button_path.setMinimumSize(40, 10)
         self.button_path.setMaximumSize(40, 30)
         self.save_path_hbox.addWidget(self.button_path)
-        self.button_path.clicked.connect(lambda: self.selectSaveFolder())
+        self.button_path.clicked.connect(self.selectSaveFolder)
         self.layout.addLayout(self.save_path_hbox)
 
-        # Default element table warning
-        self.skip_element_info = QCheckBox('Skip the element table warning when the used simulation does not provide used element data', self)
-        self.skip_element_info.setChecked(GlobalConf.skip_element_info)
-        self.layout.addWidget(self.skip_element_info)
-
-        # File deletion warning
-        self.skip_delete_info = QCheckBox('Skip the file deletion warning when running a simulation', self)
-        self.skip_delete_info.setChecked(GlobalConf.skip_delete_info)
-        self.layout.addWidget(self.skip_delete_info)
+        # folder dialog, created on first use and reused afterwards
+        self.folder_dialog: Union[QFileDialog, None] = None
 
-        # Load closed configurations
-        self.keep_configurations_info = QCheckBox('Keep configurations in all simulation tabs when open GUI again', self)
-        self.keep_configurations_info.setChecked(GlobalConf.keep_configurations_info)
-        self.layout.addWidget(self.keep_configurations_info)
-
-        # Open in multiple tabs warning (not needed)
-        """
-        self.skip_open_multiple_info = QCheckBox('Skip the information, that opening a configuration in all tabs will create multiple copies', self)
-        self.skip_open_multiple_info.setChecked(GlobalConf.skip_open_multiple_info)
-        self.layout.addWidget(self.skip_open_multiple_info)
-        """
-
-        # Open in multiple tabs warning
-        self.use_default_language = QCheckBox('Use system language for elements (if supported by simulation)', self)
-        self.use_default_language.setChecked(GlobalConf.use_default_language)
-        self.layout.addWidget(self.use_default_language)
-
-        # Open in multiple tabs warning
-        self.no_autodetect_version = QCheckBox('Do not warn if other simulation was detected than selected', self)
-        self.no_autodetect_version.setChecked(GlobalConf.no_autodetect_version)
-        self.layout.addWidget(self.no_autodetect_version)
+        # preference checkboxes
+        self.checkboxes = {}
+        for name, text in self.preference_checkboxes:
+            checkbox = QCheckBox(text, self)
+            checkbox.setChecked(getattr(GlobalConf, name))
+            self.layout.addWidget(checkbox)
+            self.checkboxes[name] = checkbox
 
         # Ok button
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok)
@@ -235,24 +269,28 @@ class PreferencesDialog(QDialog):
 
     def selectSaveFolder(self):
         """Select a default save folder"""
-        start_dir = GlobalConf.save_path
-        folder_dir = QFileDialog.getExistingDirectory(self, 'Select the default save folder', start_dir)
 
-        if folder_dir:
-            self.label_path.setText(folder_dir)
+        if self.folder_dialog is None:
+            self.folder_dialog = QFileDialog(self, 'Select the default save folder')
+            self.folder_dialog.setFileMode(QFileDialog.Directory)
+            self.folder_dialog.setOption(QFileDialog.ShowDirsOnly)
+
+        self.folder_dialog.setDirectory(GlobalConf.save_path)
+        if not self.folder_dialog.exec_():
+            return
+
+        folder_dirs = self.folder_dialog.selectedFiles()
+        if folder_dirs and folder_dirs[0]:
+            self.label_path.setText(folder_dirs[0])
 
     def updatePreferences(self):
         """Updates all preferences"""
 
         GlobalConf.save_path = self.label_path.text()
 
-        GlobalConf.skip_element_info = self.skip_element_info.isChecked()
-        GlobalConf.skip_delete_info = self.skip_delete_info.isChecked()
-        # GlobalConf.skip_open_multiple_info = self.skip_open_multiple_info.isChecked()
-        GlobalConf.keep_configurations_info = self.keep_configurations_info.isChecked()
-        GlobalConf.no_autodetect_version = self.no_autodetect_version.isChecked()
+        for name, checkbox in self.checkboxes.items():
+            setattr(GlobalConf, name, checkbox.isChecked())
 
-        GlobalConf.use_default_language = self.use_default_language.isChecked()
         GlobalConf.setLanguage()
 
         self.accept()
@@ -265,6 +303,20 @@ class AboutDialog(QDialog):
     :param parent: parent widget
     """
 
+    # about text of the GUI
+    iap_about = (
+        'Alexander Redl <a href="mailto:redl@iap.tuwien.ac.at">redl@iap.tuwien.ac.at</a><br>'
+        'David Weichselbaum <a href="mailto:weichselbaum@iap.tuwien.ac.at">weichselbaum@iap.tuwien.ac.at</a><br>'
+        'Paul S. Szabo <a href="mailto:szabo@iap.tuwien.ac.at">szabo@iap.tuwien.ac.at</a><br>'
+        '(now at University of California, Berkeley, <a href="mailto:szabo@berkeley.edu">szabo@berkeley.edu</a>)<br>'
+        'Herbert Biber <a href="mailto:biber@iap.tuwien.ac.at">biber@iap.tuwien.ac.at</a><br>'
+        'Christian Cupak<br>'
+        'Rihard A. Wilhelm<br>'
+        'Friedrich Aumayr<br><br>'
+        'Licensed under the <a href="https://www.gnu.org/licenses/gpl-3.0.html">GPLv3</a> license<br><br>'
+        '<a href="https://www.iap.tuwien.ac.at">https://www.iap.tuwien.ac.at</a><br>'
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -281,22 +333,12 @@ class AboutDialog(QDialog):
         self.layout.addWidget(self.title_label_gui, 0, 0, 1, 2)
 
         self.iap_logo = QLabel('', self)
-        self.iap_logo.setPixmap(QPixmap(':icons/aboutlogo_iap.png').scaled(280, 113, transformMode=Qt.SmoothTransformation))
+        self.iap_logo.setPixmap(scaledPixmap(':icons/aboutlogo_iap.png', 280, 113))
         self.layout.addWidget(self.iap_logo, 1, 0)
 
-        self.iap_label = QLabel(
-            'Alexander Redl <a href="mailto:redl@iap.tuwien.ac.at">redl@iap.tuwien.ac.at</a><br>' +
-            'David Weichselbaum <a href="mailto:weichselbaum@iap.tuwien.ac.at">weichselbaum@iap.tuwien.ac.at</a><br>' +
-            'Paul S. Szabo <a href="mailto:szabo@iap.tuwien.ac.at">szabo@iap.tuwien.ac.at</a><br>' +
-            '(now at University of California, Berkeley, <a href="mailto:szabo@berkeley.edu">szabo@berkeley.edu</a>)<br>' +
-            'Herbert Biber <a href="mailto:biber@iap.tuwien.ac.at">biber@iap.tuwien.ac.at</a><br>' +
-            'Christian Cupak<br>' +
-            'Rihard A. Wilhelm<br>' +
-            'Friedrich Aumayr<br><br>' +
-            'Licensed under the <a href="https://www.gnu.org/licenses/gpl-3.0.html">GPLv3</a> license<br><br>' +
-            '<a href="https://www.iap.tuwien.ac.at">https://www.iap.tuwien.ac.at</a><br>',
-            self
-        )
+        self.iap_label = QLabel(self)
+        self.iap_label.setTextFormat(Qt.RichText)
+        self.iap_label.setText(self.iap_about)
         self.iap_label.setOpenExternalLinks(True)
         self.layout.addWidget(self.iap_label, 1, 1)
 
@@ -305,7 +347,7 @@ class AboutDialog(QDialog):
         self.layout.addWidget(self.empty, 2, 0, 2, 2)
 
         # load simulation abouts
-        simulation_list = SimulationsList()
+        simulation_list = SimulationConfiguration.getSimulationsList()
         layout_index = 3
 
         for title, logo, about in zip(
@@ -322,10 +364,12 @@ class AboutDialog(QDialog):
 
             if logo:
                 logo_label = QLabel('', self)
-                logo_label.setPixmap(QPixmap(logo).scaled(280, 100, transformMode=Qt.SmoothTransformation))
+                logo_label.setPixmap(scaledPixmap(logo, 280, 100))
                 self.layout.addWidget(logo_label, layout_index, 0)
 
-            information_label = QLabel(about.strip().replace('\n', '<br>'), self)
+            information_label = QLabel(self)
+            information_label.setTextFormat(Qt.RichText)
+            information_label.setText(about.strip().replace('\n', '<br>'))
             information_label.setOpenExternalLinks(True)
             self.layout.addWidget(information_label, layout_index, 1)
             layout_index += 1
@@ -16,7 +16,9 @@
 # https://www.gnu.org/licenses/.
 
 
-from PyQt5.QtCore import QDir, QSettings, QLocale
+from atexit import register
+
+from PyQt5.QtCore import QDir, QSettings, QLocale, QByteArray
 
 
 class GlobalConf:
@@ -31,33 +33,37 @@ class GlobalConf:
     settings = QSettings('TU Wien', title)
 
     # path of save folder
-    save_path_name = 'save_path'
-    save_path = settings.value(save_path_name, defaultValue=f'{QDir.currentPath()}/saves', type=str)
+    save_path = f'{QDir.currentPath()}/saves'
 
     # language
     language = 'en'
-    use_default_language_name = 'use_default_language'
-    use_default_language = settings.value(use_default_language_name, defaultValue=True, type=bool)
-
-    # preferences
-    skip_element_info_name = 'skip_element_info'
-    skip_element_info = settings.value(skip_element_info_name, defaultValue=False, type=bool)
-
-    skip_delete_info_name = 'skip_delete_info'
-    skip_delete_info = settings.value(skip_delete_info_name, defaultValue=False, type=bool)
+    use_default_language = True
 
-    skip_open_multiple_info_name = 'skip_open_multiple_info'
-    skip_open_multiple_info = settings.value(skip_open_multiple_info_name, defaultValue=False, type=bool)
+    # language of the computer, only looked up once
+    system_language = None
 
-    keep_configurations_info_name = 'keep_configurations_info'
-    keep_configurations_info = settings.value(keep_configurations_info_name, defaultValue=True, type=bool)
-
-    no_autodetect_version_name = 'no_autodetect_version'
-    no_autodetect_version = settings.value(no_autodetect_version_name, defaultValue=False, type=bool)
+    # preferences
+    skip_element_info = False
+    skip_delete_info = False
+    skip_open_multiple_info = False
+    keep_configurations_info = True
+    no_autodetect_version = False
+
+    # preferences stored in the settings object (under the same name), the values above are their default values
+    preference_names = [
+        'save_path',
+        'use_default_language',
+        'skip_element_info',
+        'skip_delete_info',
+        'skip_open_multiple_info',
+        'keep_configurations_info',
+        'no_autodetect_version'
+    ]
 
     # window parameters
     window_width_name = 'window_width'
     window_height_name = 'window_height'
+    window_geometry_name = 'window_geometry'
 
     def __init__(self):
         self.setLanguage()
@@ -69,26 +75,24 @@ class GlobalConf:
             GlobalConf.language = 'en'
             return
 
-        pc_lang = QLocale().system().name()
-        pc_lang = pc_lang.split('_')[0]
-        if pc_lang != GlobalConf.language:
-            GlobalConf.language = f'{pc_lang}|{GlobalConf.language}'
+        if GlobalConf.system_language is None:
+            GlobalConf.system_language = QLocale.system().name().split('_')[0]
+
+        pc_lang = GlobalConf.system_language
+        GlobalConf.language = 'en' if pc_lang == 'en' else f'{pc_lang}|en'
+
+    @staticmethod
+    def loadSettings():
+        """Loads general variables from settings object"""
+        for name in GlobalConf.preference_names:
+            default_value = getattr(GlobalConf, name)
+            setattr(GlobalConf, name, GlobalConf.settings.value(name, defaultValue=default_value, type=type(default_value)))
 
     @staticmethod
     def updateSettings():
         """Updates and saves settings object with general variables"""
-        update_dict = {
-            GlobalConf.save_path_name: GlobalConf.save_path,
-            GlobalConf.use_default_language_name: GlobalConf.use_default_language,
-            GlobalConf.skip_element_info_name: GlobalConf.skip_element_info,
-            GlobalConf.skip_delete_info_name: GlobalConf.skip_delete_info,
-            GlobalConf.skip_open_multiple_info_name: GlobalConf.skip_open_multiple_info,
-            GlobalConf.keep_configurations_info_name: GlobalConf.keep_configurations_info,
-            GlobalConf.no_autodetect_version_name: GlobalConf.no_autodetect_version
-        }
-
-        for key, value in update_dict.items():
-            GlobalConf.settings.setValue(key, value)
+        for name in GlobalConf.preference_names:
+            GlobalConf.settings.setValue(name, getattr(GlobalConf, name))
 
         GlobalConf.settings.sync()
 
@@ -96,7 +100,6 @@ class GlobalConf:
     def setValue(key: str, value):
         """Sets value to key"""
         GlobalConf.settings.setValue(key, value)
-        GlobalConf.settings.sync()
 
     @staticmethod
     def getValue(key: str, default_value=None, **kwargs):
@@ -104,15 +107,23 @@ class GlobalConf:
         return GlobalConf.settings.value(key, defaultValue=default_value, **kwargs)
 
     @staticmethod
-    def updateWindowSize(width, height):
-        """Updates and saves settings object with window parameters"""
-        GlobalConf.settings.setValue(GlobalConf.window_width_name, width)
-        GlobalConf.settings.setValue(GlobalConf.window_height_name, height)
+    def updateWindowGeometry(geometry: QByteArray):
+        """Updates settings object with window geometry (as returned by saveGeometry() of the window)"""
+        GlobalConf.settings.setValue(GlobalConf.window_geometry_name, geometry)
 
-        GlobalConf.settings.sync()
+    @staticmethod
+    def getWindowGeometry() -> QByteArray:
+        """Returns window geometry (to be used by restoreGeometry() of the window), empty if not stored yet"""
+        return GlobalConf.settings.value(GlobalConf.window_geometry_name, defaultValue=QByteArray(), type=QByteArray)
 
     @staticmethod
     def getWindowSize():
         """Returns (width, height) of window"""
         return (GlobalConf.settings.value(GlobalConf.window_width_name, defaultValue=1100, type=int),
                 GlobalConf.settings.value(GlobalConf.window_height_name, defaultValue=800, type=int))
+
+
+GlobalConf.loadSettings()
+
+# single values are not saved when they are set (Qt saves them from the event loop), but at the latest when exiting
+register(GlobalConf.settings.sync)
@@ -16,11 +16,12 @@
 # https://www.gnu.org/licenses/.
 
 
-from typing import List
+from typing import List, Set, Callable, Union, Optional
+from functools import partial
 
-from PyQt5.QtCore import Qt, QCoreApplication, QFileInfo, QUrl, QDir
-from PyQt5.QtGui import QIcon, QKeySequence, QCloseEvent, QDesktopServices
-from PyQt5.QtWidgets import QMainWindow, QTabWidget, QDesktopWidget, QMessageBox
+from PyQt5.QtCore import Qt, QCoreApplication, QFileInfo, QUrl, QDir, QTimer
+from PyQt5.QtGui import QKeySequence, QCloseEvent, QDesktopServices
+from PyQt5.QtWidgets import QMainWindow, QTabWidget, QDesktopWidget, QMessageBox, QMenu, QAction
 
 import resources
 
@@ -28,9 +29,10 @@ from GlobalConf import GlobalConf
 from Dialogs import AboutDialog, ManualDialog, PreferencesDialog
 
 from Utility.Dialogs import selectFileDialog, showMessageBox, DownloadDialog
+from Utility.ModifyWidget import cachedIcon
 
 from Pages.ConfigurationPage import ConfigurationPage
-from Pages.ProgramPage import SimulationPage
+from Pages.ProgramPage import LazySimulationPage
 
 from Containers.SimulationConfiguration import SimulationConfiguration
 
@@ -49,7 +51,8 @@ class MainWindow(QMainWindow):
         #
 
         self.simulation_configs: List[SimulationConfiguration] = []  # configuration data for each simulation
-        self.old_simulation_configs: List[SimulationConfiguration] = []
+        self.old_simulation_configs: Set[SimulationConfiguration] = set()  # configurations that have a tab
+        self.active_simulation_config: Optional[SimulationConfiguration] = None  # configuration of active tab
 
         #
         # QCoreApplication Parameters
@@ -59,9 +62,9 @@ class MainWindow(QMainWindow):
         QCoreApplication.setOrganizationDomain('www.tuwien.at')
         QCoreApplication.setApplicationName(GlobalConf.title)
 
-        super().__init__()
-        self.setWindowIcon(QIcon(':/icons/tu_logo.png'))
+        self.setWindowIcon(cachedIcon(':/icons/tu_logo.png'))
         self.window_title = GlobalConf.title
+        self.shown_window_title = ''
 
         #
         # MENU BAR
@@ -73,77 +76,77 @@ class MainWindow(QMainWindow):
         self.menu_file.setToolTipsVisible(True)
 
         # Save all
-        self.action_save_all = self.menu_file.addAction(QIcon(':/icons/save.png'), 'Save all')
-        self.action_save_all.setToolTip('Save configuration for all tabs')
-        self.action_save_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_S))
-        self.action_save_all.triggered.connect(lambda: self.menuSave())
+        self.action_save_all = self.addMenuAction(
+            self.menu_file, 'Save all', self.menuSave, ':/icons/save.png',
+            'Save configuration for all tabs', QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_S)
+        )
 
         # Open all - not needed
-        # self.action_open_all = self.menu_file.addAction(QIcon(':/icons/open.png'), 'Open all')
-        # self.action_open_all.setToolTip('Open one configuration for all tabs')
-        # self.action_open_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_O))
-        # self.action_open_all.triggered.connect(lambda: self.menuOpen())
+        # self.action_open_all = self.addMenuAction(
+        #     self.menu_file, 'Open all', self.menuOpen, ':/icons/open.png',
+        #     'Open one configuration for all tabs', QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_O)
+        # )
 
         # Reset all
-        self.action_reset_all = self.menu_file.addAction(QIcon(':/icons/refresh.png'), 'Reset all')
-        self.action_reset_all.setToolTip('Resets configuration for all tabs')
-        self.action_reset_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_N))
-        self.action_reset_all.triggered.connect(lambda: self.menuReset())
+        self.action_reset_all = self.addMenuAction(
+            self.menu_file, 'Reset all', self.menuReset, ':/icons/refresh.png',
+            'Resets configuration for all tabs', QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_N)
+        )
 
         self.menu_file.addSeparator()
 
         # Close all
-        self.action_close_all = self.menu_file.addAction(QIcon(':/icons/close.png'), 'Close all tabs')
-        self.action_close_all.setToolTip('Closes all tabs')
-        self.action_close_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_W))
-        self.action_close_all.triggered.connect(lambda: self.menuCloseAll())
+        self.action_close_all = self.addMenuAction(
+            self.menu_file, 'Close all tabs', self.menuCloseAll, ':/icons/close.png',
+            'Closes all tabs', QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_W)
+        )
 
         self.menu_file.addSeparator()
 
         # Preferences
-        self.action_preferences = self.menu_file.addAction(QIcon(':/icons/preferences.png'), 'Preferences')
-        self.action_preferences.setToolTip('Open preferences dialog')
-        self.action_preferences.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_H))
-        self.action_preferences.triggered.connect(lambda: PreferencesDialog(self).open())
+        self.action_preferences = self.addMenuAction(
+            self.menu_file, 'Preferences', lambda: PreferencesDialog(self).open(), ':/icons/preferences.png',
+            'Open preferences dialog', QKeySequence(Qt.CTRL + Qt.Key_H)
+        )
 
         self.menu_file.addSeparator()
 
         # Quit
-        self.action_quit = self.menu_file.addAction('Quit')
-        self.action_quit.setToolTip('Quit the program')
-        self.action_quit.setShortcut(QKeySequence.Quit)
-        self.action_quit.triggered.connect(lambda: self.close())
+        self.action_quit = self.addMenuAction(
+            self.menu_file, 'Quit', self.close,
+            tooltip='Quit the program', shortcut=QKeySequence.Quit
+        )
 
         # Simulation
         self.menu_simulation = self.menu.addMenu('&Simulation')
         self.menu_simulation.setToolTipsVisible(True)
 
         # Close current tab
-        self.closeAction = self.menu_simulation.addAction(QIcon(':/icons/close.png'), 'Close current tab')
-        self.closeAction.setToolTip('Closes currently active tab')
-        self.closeAction.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_W))
+        self.closeAction = self.addMenuAction(
+            self.menu_simulation, 'Close current tab', self.menuClose, ':/icons/close.png',
+            'Closes currently active tab', QKeySequence(Qt.CTRL + Qt.Key_W)
+        )
         self.closeAction.setDisabled(True)
-        self.closeAction.triggered.connect(lambda: self.menuClose())
 
         self.menu_simulation.addSeparator()
 
         # Run all tabs
-        self.action_run_all = self.menu_simulation.addAction(QIcon(':/icons/play.png'), 'Run all tabs')
-        self.action_run_all.setToolTip('Runs all opened tab')
-        self.action_run_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_R))
-        self.action_run_all.triggered.connect(lambda: self.menuRun())
+        self.action_run_all = self.addMenuAction(
+            self.menu_simulation, 'Run all tabs', lambda: self.menuRun(), ':/icons/play.png',
+            'Runs all opened tab', QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_R)
+        )
 
         # Run all tabs detached
-        self.action_run_all_detached = self.menu_simulation.addAction(QIcon(':/icons/play_detached.png'), 'Run all tabs detached')
-        self.action_run_all_detached.setToolTip('Runs all opened tab in detached mode')
-        self.action_run_all_detached.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + Qt.SHIFT + Qt.Key_R))
-        self.action_run_all_detached.triggered.connect(lambda: self.menuRun(detached=True))
+        self.action_run_all_detached = self.addMenuAction(
+            self.menu_simulation, 'Run all tabs detached', lambda: self.menuRun(detached=True), ':/icons/play_detached.png',
+            'Runs all opened tab in detached mode', QKeySequence(Qt.CTRL + Qt.ALT + Qt.SHIFT + Qt.Key_R)
+        )
 
         # Abort all tabs
-        self.action_abort_all = self.menu_simulation.addAction(QIcon(':/icons/abort.png'), 'Abort all tabs')
-        self.action_abort_all.setToolTip('Aborts all running tabs')
-        self.action_abort_all.setShortcut(QKeySequence(Qt.CTRL + Qt.ALT + + Qt.Key_P))
-        self.action_abort_all.triggered.connect(lambda: self.menuAbort())
+        self.action_abort_all = self.addMenuAction(
+            self.menu_simulation, 'Abort all tabs', self.menuAbort, ':/icons/abort.png',
+            'Aborts all running tabs', QKeySequence(Qt.CTRL + Qt.ALT + + Qt.Key_P)
+        )
 
         # Help
         self.menu_help = self.menu.addMenu('&Help')
@@ -151,16 +154,15 @@ class MainWindow(QMainWindow):
 
         # Manual
         self.manual_path = QDir.currentPath()
-        self.action_manual = self.menu_help.addAction(QIcon(':/icons/book.png'), 'Manual')
-        self.action_manual.triggered.connect(self.openUserManual)
+        self.action_manual = self.addMenuAction(self.menu_help, 'Manual', self.openUserManual, ':/icons/book.png')
 
-        # Manual
-        self.action_manual = self.menu_help.addAction(QIcon(':/icons/help.png'), 'Quick Manual')
-        self.action_manual.triggered.connect(lambda: ManualDialog(self).show())
+        # Quick manual
+        self.action_quick_manual = self.addMenuAction(
+            self.menu_help, 'Quick Manual', lambda: ManualDialog(self).show(), ':/icons/help.png'
+        )
 
         # About
-        self.action_about = self.menu_help.addAction('About')
-        self.action_about.triggered.connect(lambda: AboutDialog(self).open())
+        self.action_about = self.addMenuAction(self.menu_help, 'About', lambda: AboutDialog(self).open())
 
         self.setMenuBar(self.menu)
 
@@ -169,13 +171,15 @@ class MainWindow(QMainWindow):
         #
 
         self.tab_simulations = QTabWidget(self)
-        self.tab_simulations.currentChanged.connect(lambda index: self.tabChanged(index))
+        self.tab_simulations.currentChanged.connect(self.tabChanged)
         self.setCentralWidget(self.tab_simulations)
 
         # Add simulation configuration tab
         self.simulation_configuration_page = ConfigurationPage(self)
         self.addSimulationTab(self.simulation_configuration_page, 'Configurations')
-        self.simulation_configuration_page.open(default=True)
+
+        # load last configurations once the event loop runs, so the window is shown first
+        QTimer.singleShot(0, partial(self.simulation_configuration_page.open, default=True))
 
         #
         # STATUS BAR
@@ -187,19 +191,41 @@ class MainWindow(QMainWindow):
         # Setup window location and signals
         #
 
-        # TODO: also store display where GUI was displayed
+        self.tab_simulations.currentChanged.connect(self.writeWindowTitleTab)
 
-        self.tab_simulations.currentChanged.connect(lambda index: self.writeWindowTitleTab(index))
+        # restore stored geometry (including display and maximized state) or fall back to stored size
+        if not self.restoreGeometry(GlobalConf.getWindowGeometry()):
+            width, height = GlobalConf.getWindowSize()
+            if width == height == -1:
+                self.showMaximized()
+            else:
+                self.resize(width, height)
+                frame_geometry = self.frameGeometry()
+                center_point = QDesktopWidget().availableGeometry().center()
+                frame_geometry.moveCenter(center_point)
+                self.move(frame_geometry.topLeft())
+
+    @staticmethod
+    def addMenuAction(menu: QMenu, text: str, slot: Callable, icon: str = None, tooltip: str = None,
+                      shortcut: Union[QKeySequence, QKeySequence.StandardKey] = None) -> QAction:
+        """
+        Adds an action to a menu and returns it
+
+        :param menu: menu the action is added to
+        :param text: text of action
+        :param slot: function that is called when action is triggered
+        :param icon: (optional) path to icon of action
+        :param tooltip: (optional) tooltip of action
+        :param shortcut: (optional) shortcut of action
+        """
 
-        width, height = GlobalConf.getWindowSize()
-        if width == height == -1:
-            self.showMaximized()
-        else:
-            self.resize(width, height)
-            frame_geometry = self.frameGeometry()
-            center_point = QDesktopWidget().availableGeometry().center()
-            frame_geometry.moveCenter(center_point)
-            self.move(frame_geometry.topLeft())
+        action = menu.addAction(cachedIcon(icon), text) if icon is not None else menu.addAction(text)
+        if tooltip is not None:
+            action.setToolTip(tooltip)
+        if shortcut is not None:
+            action.setShortcut(shortcut)
+        action.triggered.connect(slot)
+        return action
 
     def addSimulationTab(self, widget, title: str):
         """
@@ -251,17 +277,19 @@ class MainWindow(QMainWindow):
         :param sc: changed SimulationConfiguration
         """
 
-        index = self.tab_simulations.indexOf(sc.tab_widget)
         title = sc.title
         if sc.running:
             title = f'{title} ⧖'
         elif sc.unsaved_changes:
             title = f'{title} *'
-        self.tab_simulations.setTabText(index, title)
 
-        index = self.tab_simulations.indexOf(sc.tab_widget)
-        if self.tab_simulations.currentIndex() == index:
-            self.writeWindowTitleTab(index)
+        # only look up and change the tab if its text changed
+        if title != sc.tab_title:
+            sc.tab_title = title
+            self.tab_simulations.setTabText(self.tab_simulations.indexOf(sc.tab_widget), title)
+
+        if sc.is_active:
+            self.writeWindowTitleTab(self.tab_simulations.currentIndex())
 
     def tabChanged(self, index: int):
         """
@@ -277,13 +305,15 @@ class MainWindow(QMainWindow):
         # disable/enable close current tab - menu
         self.closeAction.setDisabled(index == 0)
 
-        # set active flags for each simulation configuration
-        for i in range(self.tab_simulations.count()):
-            widget = self.tab_simulations.widget(i)
-            # check if simulation page or configuration page is selected
-            if isinstance(widget, SimulationPage):
-                sc = widget.simulation_configuration
-                sc.is_active = i == index
+        # set active flag, only the previously active simulation configuration needs to be reset
+        if self.active_simulation_config is not None:
+            self.active_simulation_config.is_active = False
+            self.active_simulation_config = None
+
+        # check if simulation page or configuration page is selected
+        if isinstance(tab_widget, LazySimulationPage):
+            self.active_simulation_config = tab_widget.simulation_configuration
+            self.active_simulation_config.is_active = True
 
     def writeStatusBar(self, msg: str, visible_time: int = 3000):
         """
@@ -305,33 +335,53 @@ class MainWindow(QMainWindow):
         widget = self.tab_simulations.widget(index)
 
         # check if simulation page or configuration page is selected
-        if isinstance(widget, SimulationPage):
+        if isinstance(widget, LazySimulationPage):
             sc = widget.simulation_configuration
             window_title = f'{self.window_title}: {sc.title} (Prog: {sc.program_name} v{sc.version})'
             if sc.running:
                 window_title = f'{window_title} ⧖'
             elif sc.unsaved_changes:
                 window_title = f'{window_title} *'
-            self.setWindowTitle(window_title)
         else:
-            self.setWindowTitle(self.window_title)
+            window_title = self.window_title
+
+        # only set if changed, since simulation pages report every change
+        if window_title != self.shown_window_title:
+            self.shown_window_title = window_title
+            self.setWindowTitle(window_title)
 
     def updateTabs(self):
         """Updates tabs if simulation configuration changed"""
 
-        for sc in self.simulation_configs:
-            if sc not in self.old_simulation_configs:
-                self.old_simulation_configs.append(sc)
-                sc.tab_widget = self.addSimulationTab(SimulationPage(self, sc), sc.title)
-            if sc.changed:
-                self.changeSimulationTab(sc.tab_widget, sc.title)
-                sc.changed = False
-
-        for sc in self.old_simulation_configs:
-            if sc not in self.simulation_configs:
+        simulation_configs = set(self.simulation_configs)
+        tabs_changed = False
+
+        # signals are blocked while tabs are added or removed, the tab change is handled once afterwards
+        signals_blocked = self.tab_simulations.blockSignals(True)
+        try:
+            for sc in self.simulation_configs:
+                if sc not in self.old_simulation_configs:
+                    # simulation pages are only created when their tab is shown the first time
+                    sc.tab_widget = self.addSimulationTab(LazySimulationPage(self, sc), sc.title)
+                    sc.tab_title = sc.title
+                    tabs_changed = True
+                if sc.changed:
+                    self.changeSimulationTab(sc.tab_widget, sc.title)
+                    sc.tab_title = sc.title
+                    sc.changed = False
+
+            for sc in self.old_simulation_configs - simulation_configs:
                 self.removeSimulationTab(sc.tab_widget)
+                tabs_changed = True
+        finally:
+            self.tab_simulations.blockSignals(signals_blocked)
 
-        self.old_simulation_configs = self.simulation_configs.copy()
+        self.old_simulation_configs = simulation_configs
+
+        if tabs_changed:
+            index = self.tab_simulations.currentIndex()
+            self.tabChanged(index)
+            self.writeWindowTitleTab(index)
 
     def menuSave(self):
         """Save all tabs"""
@@ -372,16 +422,17 @@ class MainWindow(QMainWindow):
     def menuCloseAll(self):
         """Closes all tabs"""
 
-        # delete current tab
+        # delete closeable tabs, keep the others in one pass
         non_closable = []
-        for selected_conf in reversed(self.simulation_configs):
-            if selected_conf is not None:
-                # check if it is closeable
-                if selected_conf.tab_widget is not None:
-                    if not selected_conf.tab_widget.isClosable():
-                        non_closable.append(selected_conf.title)
-                    else:
-                        self.simulation_configs.remove(selected_conf)
+        keep_configs = []
+        for selected_conf in self.simulation_configs:
+            # check if it is closeable
+            if selected_conf is None or selected_conf.tab_widget is None:
+                keep_configs.append(selected_conf)
+            elif not selected_conf.tab_widget.isClosable():
+                non_closable.append(selected_conf.title)
+                keep_configs.append(selected_conf)
+        self.simulation_configs[:] = keep_configs
 
         if non_closable:
             showMessageBox(
@@ -429,10 +480,12 @@ class MainWindow(QMainWindow):
         """
 
         non_closeable = []
+        run_configs = []
         for sc in self.simulation_configs:
             if sc.tab_widget is not None:
                 if sc.running:
                     non_closeable.append(f'» "{sc.title}" is running')
+                run_configs.append(sc)
 
         if non_closeable:
             _, result = showMessageBox(
@@ -445,7 +498,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        for sc in self.simulation_configs:
+        for sc in run_configs:
             sc.tab_widget.runSimulation(detached=detached)
 
     def menuAbort(self):
@@ -453,12 +506,14 @@ class MainWindow(QMainWindow):
 
         for sc in self.simulation_configs:
             if sc.running:
-                sc.tab_widget.process.kill()
+                sc.tab_widget.killProcess()
 
     def openUserManual(self):
         """Opens the user-manual of the GUI"""
-        url = QUrl(f'{self.manual_path}/BCA-GUIDE_manual.pdf')
-        opened = QDesktopServices.openUrl(url)
+        manual_file = f'{self.manual_path}/BCA-GUIDE_manual.pdf'
+
+        # only try to open the manual if it exists, since opening a missing file can take a while to fail
+        opened = QFileInfo(manual_file).isFile() and QDesktopServices.openUrl(QUrl(manual_file))
 
         # if failed to open, try to download it
         if not opened:
@@ -484,17 +539,30 @@ class MainWindow(QMainWindow):
         if closable:
             self.simulation_configuration_page.save(autosave=True, no_config=not GlobalConf.keep_configurations_info)
 
-            # terminate all running processes
+            # the last autosave has to be written before closing
+            save_error = self.simulation_configuration_page.waitSave()
+            if save_error is not None:
+                _, result = showMessageBox(
+                    self,
+                    QMessageBox.Warning,
+                    'Warning!',
+                    'The configurations could not be saved',
+                    info_message='Close anyways?',
+                    detailed_message=str(save_error),
+                    standard_buttons=QMessageBox.Ok | QMessageBox.Abort
+                )
+                if result == QMessageBox.Abort:
+                    event.ignore()
+                    return
+
+            # terminate all running processes (kill() does not wait for the processes to finish)
             for sc in self.simulation_configs:
-                sc.tab_widget.process.kill()
+                if sc.running and sc.tab_widget is not None:
+                    sc.tab_widget.killProcess()
 
             GlobalConf.updateSettings()
 
-            if self.isMaximized():
-                dimensions = (-1, -1)
-            else:
-                dimensions = self.width(), self.height()
-            GlobalConf.updateWindowSize(*dimensions)
+            GlobalConf.updateWindowGeometry(self.saveGeometry())
 
             event.accept()
 
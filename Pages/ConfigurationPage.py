@@ -17,13 +17,15 @@
 
 
 from __future__ import annotations
-from typing import Union, Optional, TYPE_CHECKING
+from typing import Union, Optional, Tuple, Dict, TYPE_CHECKING
 from platform import system
-from json import dump, load
+from os import replace, remove, path
+from threading import Thread, Lock
+from json import dumps, loads
 from json.decoder import JSONDecodeError
 
-from PyQt5.QtCore import Qt, QTimer, QDir, QFileInfo
-from PyQt5.QtGui import QIcon, QKeySequence, QPixmap
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer, QDir, QFileInfo
+from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (
     QSplitter, QWidget, QPushButton, QListWidget, QLabel, QListWidgetItem,
     QVBoxLayout, QGroupBox, QHBoxLayout, QMessageBox, QFileDialog, QSizePolicy
@@ -34,13 +36,12 @@ from Styles import Styles
 
 from Utility.Layouts import TabWithToolbar, VBoxTitleLayout, InputHBoxLayout, LineEdit, FilePath, ComboBox
 from Utility.Dialogs import showMessageBox, selectFileDialog
+from Utility.ModifyWidget import cachedIcon, scaledPixmap
 
-from Pages.ProgramPage import SimulationPage
+from Pages.ProgramPage import LazySimulationPage
 
 from Containers.SimulationConfiguration import SimulationConfiguration
 
-from Simulations.SimulationsList import SimulationsList
-
 # avoiding circular import, but still get type hinting functionality
 if TYPE_CHECKING:
     from MainWindow import MainWindow
@@ -51,6 +52,9 @@ class ConfigurationPage(TabWithToolbar):
     Page for configuring the basic simulation parameters
     """
 
+    # emitted by the thread writing autosave files, with True if the file was written successfully
+    autosaveWritten = pyqtSignal(bool)
+
     def __init__(self, main_window: MainWindow):
         """
         :param main_window: main Window object
@@ -65,26 +69,41 @@ class ConfigurationPage(TabWithToolbar):
         #
 
         self.selected_configuration: Optional[SimulationConfiguration] = None
+        # configurations by their title (as listed in the configuration list), updated when they are listed
+        self.configurations_by_title: Dict[str, SimulationConfiguration] = {}
         self.new_configuration_text = 'Add new configuration'
+        # if the configuration editor has changes that are not saved (shown in the save button)
+        self.unsaved_configuration = False
+        # thread writing autosave files, autosaves made while it is writing are combined into the next write
+        self.save_thread: Optional[Thread] = None
+        # lock for the autosave state below, which is shared with the thread
+        self.save_lock = Lock()
+        self.save_pending: Optional[Tuple[str, list]] = None
+        self.save_writing = False
+        # error of the last autosave, None if it was written successfully
+        self.save_error: Optional[Exception] = None
+        # last successfully written autosave (file and configurations), the same autosave is not written again
+        self.last_autosave: Optional[Tuple[str, list]] = None
+        self.autosaveWritten.connect(self.autosaveFinished)
 
         #
         # TOOLBAR
         #
 
         # New
-        self.action_new = self.toolbar.addAction(QIcon(':/icons/new.png'), 'New')
+        self.action_new = self.toolbar.addAction(cachedIcon(':/icons/new.png'), 'New')
         self.action_new.setToolTip('Reset all configured Simulations')
         self.action_new.setShortcut(QKeySequence.New)
         self.action_new.triggered.connect(lambda: self.clearAll())
 
         # Open
-        self.action_open = self.toolbar.addAction(QIcon(':/icons/open.png'), 'Open')
+        self.action_open = self.toolbar.addAction(cachedIcon(':/icons/open.png'), 'Open')
         self.action_open.setToolTip('Open saved simulation configurations')
         self.action_open.setShortcut(QKeySequence.Open)
         self.action_open.triggered.connect(lambda: self.open())
 
         # Save
-        self.action_save = self.toolbar.addAction(QIcon(':/icons/save.png'), 'Save')
+        self.action_save = self.toolbar.addAction(cachedIcon(':/icons/save.png'), 'Save')
         self.action_save.setToolTip('Save all listed simulation configurations')
         self.action_save.setShortcut(QKeySequence.Save)
         self.action_save.triggered.connect(lambda: self.save())
@@ -95,13 +114,13 @@ class ConfigurationPage(TabWithToolbar):
         self.toolbar.addWidget(self.empty_space)
 
         # Run
-        self.action_run = self.toolbar.addAction(QIcon(':/icons/play.png'), 'Run')
+        self.action_run = self.toolbar.addAction(cachedIcon(':/icons/play.png'), 'Run')
         self.action_run.setToolTip('Run the selected simulation(s)')
         self.action_run.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_R))
         self.action_run.triggered.connect(lambda: self.runSelected())
 
         # Run detached
-        self.action_run_detached = self.toolbar.addAction(QIcon(':/icons/play_detached.png'), 'Run detached')
+        self.action_run_detached = self.toolbar.addAction(cachedIcon(':/icons/play_detached.png'), 'Run detached')
         self.action_run_detached.setToolTip('Run the selected simulation(s) in detached mode.\nThe simulation(s) is(are) run in a separate window, and the GUI can be closed')
         self.action_run_detached.setShortcut(QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_R))
         self.action_run_detached.triggered.connect(lambda: self.runSelected(detached=True))
@@ -141,8 +160,9 @@ class ConfigurationPage(TabWithToolbar):
         self.simulation_configuration_group.addLayout(self.layout_title)
 
         # Simulation program
-        self.program_tooltips = SimulationsList().simulation_program_description
-        self.program_names = SimulationsList().simulation_program_names
+        simulations_list = SimulationConfiguration.getSimulationsList()
+        self.program_tooltips = simulations_list.simulation_program_description
+        self.program_names = simulations_list.simulation_program_names
         self.program = ComboBox(
             entries=self.program_names,
             tooltips=self.program_tooltips,
@@ -154,10 +174,7 @@ class ConfigurationPage(TabWithToolbar):
             tooltip='Program used for the simulation',
             split=split
         )
-        self.program.currentIndexChanged.connect(self.getDescription)
-        self.program.currentIndexChanged.connect(self.getVersions)
-        self.program.currentIndexChanged.connect(self.unsavedConfigView)
-        self.program.currentIndexChanged.connect(self.saveFolderChanged)
+        self.program.currentIndexChanged.connect(self.programChanged)
         self.simulation_configuration_group.addLayout(self.layout_program)
 
         # Simulation version
@@ -343,19 +360,15 @@ class ConfigurationPage(TabWithToolbar):
         :param dialog: if dialog should be shown
         """
 
-        non_closeable = []
-        for sc in self.main_window.simulation_configs:
-            if sc.tab_widget is not None:
-                if not sc.tab_widget.isClosable():
-                    text = f'» {sc.title}'
-                    if sc.running:
-                        text += ' (running)'
-                    elif sc.unsaved_changes:
-                        text += ' (unsaved changes)'
-                    non_closeable.append(text)
-
+        # without dialog the descriptions of the non closeable tabs are not needed
         if not dialog:
-            return bool(non_closeable)
+            return any(sc.tab_widget is not None and not sc.tab_widget.isClosable() for sc in self.main_window.simulation_configs)
+
+        non_closeable = [
+            f'» {sc.title}' + (' (running)' if sc.running else ' (unsaved changes)' if sc.unsaved_changes else '')
+            for sc in self.main_window.simulation_configs
+            if sc.tab_widget is not None and not sc.tab_widget.isClosable()
+        ]
 
         if non_closeable:
             _, result = showMessageBox(
@@ -430,12 +443,12 @@ class ConfigurationPage(TabWithToolbar):
             return
 
         try:
-            with open(save_file, 'r') as conf_file:
-                data = load(conf_file)
-        except (FileNotFoundError, JSONDecodeError):
+            with open(save_file, 'rb') as conf_file:
+                data = loads(conf_file.read())
+        except (FileNotFoundError, JSONDecodeError, UnicodeDecodeError):
             return
 
-        scs = [SimulationConfiguration.load(d) for d in data]
+        scs = SimulationConfiguration.loadList(data)
 
         error_msg = ''
         for i, sc in enumerate(scs):
@@ -487,20 +500,126 @@ class ConfigurationPage(TabWithToolbar):
 
         config = [sc.save(no_config=no_config) for sc in self.main_window.simulation_configs]
 
-        with open(save_file, 'w') as config_file:
-            dump(config, config_file, indent=4)
+        # autosaves are written in the background, so the GUI is not blocked (result is reported by autosaveWritten)
+        if autosave:
+            with self.save_lock:
+                # skipped only if no other autosave is being written (which would replace the file) and the file still exists
+                if not self.save_writing and self.last_autosave == (save_file, config) and path.exists(save_file):
+                    self.main_window.writeStatusBar('Saving configuration file successful')
+                    return
+                self.save_pending = (save_file, config)
+                start_thread = not self.save_writing
+                self.save_writing = True
+
+            # if the thread is still writing, it will also write this autosave
+            if start_thread:
+                self.save_thread = Thread(target=self.writeAutosaves)
+                self.save_thread.start()
+            return
+
+        # writes are kept in order
+        self.waitSave()
+        try:
+            self.writeConfig(save_file, config)
+        except OSError:
+            self.main_window.writeStatusBar('Saving configuration file failed')
+            return
 
         self.main_window.writeStatusBar('Saving configuration file successful')
 
+    def autosaveFinished(self, success: bool):
+        """
+        Called (in the GUI thread) when an autosave file was written
+
+        :param success: if the autosave file was written successfully
+        """
+
+        if success:
+            self.main_window.writeStatusBar('Saving configuration file successful')
+        else:
+            self.main_window.writeStatusBar('Saving configuration file failed')
+
+    @staticmethod
+    def writeConfig(save_file: str, config: list, indent: Optional[int] = 4):
+        """
+        Writes configuration to file, the file is replaced only after it has been completely written
+
+        :param save_file: path to save file
+        :param config: list of configurations
+        :param indent: (optional) indentation of json file, None for a compact file (which can be encoded faster)
+        """
+
+        config_bytes = dumps(config, indent=indent).encode()
+        save_file_tmp = f'{save_file}.tmp'
+        try:
+            with open(save_file_tmp, 'wb') as config_file:
+                config_file.write(config_bytes)
+            replace(save_file_tmp, save_file)
+        except OSError:
+            # do not leave a partially written file behind
+            try:
+                remove(save_file_tmp)
+            except OSError:
+                pass
+            raise
+
+    def writeAutosaves(self):
+        """Writes pending autosave files (in the background thread) until there are no more pending autosaves"""
+
+        try:
+            while True:
+                with self.save_lock:
+                    if self.save_pending is None:
+                        self.save_writing = False
+                        return
+                    save_file, config = self.save_pending
+                    self.save_pending = None
+
+                try:
+                    self.writeConfig(save_file, config, indent=None)
+                except Exception as error:
+                    with self.save_lock:
+                        self.last_autosave = None
+                        self.save_error = error
+                    self.autosaveWritten.emit(False)
+                else:
+                    with self.save_lock:
+                        self.last_autosave = (save_file, config)
+                        self.save_error = None
+                    self.autosaveWritten.emit(True)
+
+        except BaseException:
+            # a new thread has to be started for the next autosave
+            with self.save_lock:
+                self.save_writing = False
+            raise
+
+    def waitSave(self) -> Optional[Exception]:
+        """Waits until the last autosave file is written and returns its error (None if it was written successfully)"""
+
+        if self.save_thread is not None:
+            self.save_thread.join()
+            self.save_thread = None
+
+        with self.save_lock:
+            return self.save_error
+
     def listConfigView(self):
         """List configuration from self.mainWindow.simConfigs dictionary"""
 
-        self.simulation_configuration_list.clear()
-        self.simulation_configuration_list.addItem(self.new_configuration_text)
-        for sc in self.main_window.simulation_configs:
-            item = QListWidgetItem(sc.title)
-            item.setCheckState(Qt.Unchecked)
-            self.simulation_configuration_list.addItem(item)
+        # list is only repainted once after all items are added
+        self.simulation_configuration_list.setUpdatesEnabled(False)
+        try:
+            self.simulation_configuration_list.clear()
+            self.simulation_configuration_list.addItem(self.new_configuration_text)
+            self.configurations_by_title = {}
+            for sc in self.main_window.simulation_configs:
+                self.configurations_by_title.setdefault(sc.title, sc)
+                item = QListWidgetItem(sc.title)
+                item.setCheckState(Qt.Unchecked)
+                self.simulation_configuration_list.addItem(item)
+        finally:
+            self.simulation_configuration_list.setUpdatesEnabled(True)
         self.main_window.updateTabs()
         self.simulation_configuration_list.setCurrentRow(0)
 
@@ -548,10 +667,9 @@ class ConfigurationPage(TabWithToolbar):
             self.delete.setDisabled(False)
 
         # Try to get SimulationConfiguration
-        for sc in self.main_window.simulation_configs:
-            if sc.title == conf_name:
-                self.selected_configuration = sc
-                break
+        sc = self.configurations_by_title.get(conf_name)
+        if sc is not None:
+            self.selected_configuration = sc
 
         # Extract variables
         if self.selected_configuration is not None:
@@ -565,8 +683,9 @@ class ConfigurationPage(TabWithToolbar):
             # self.detected_simulation.setText(f'<b>{self.selected_configuration.version}</b>')
             self.description_label.setText(self.selected_configuration.program_description.strip())
             self.save_configuration_button.setText(self.save_configuration_button_text)
+            self.unsaved_configuration = False
             if self.selected_configuration.program_logo:
-                self.description_logo.setPixmap(QPixmap(self.selected_configuration.program_logo).scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                self.description_logo.setPixmap(scaledPixmap(self.selected_configuration.program_logo, 200, 150, aspect_mode=Qt.KeepAspectRatio))
                 self.description_logo.show()
             else:
                 self.description_logo.hide()
@@ -577,7 +696,12 @@ class ConfigurationPage(TabWithToolbar):
     def unsavedConfigView(self):
         """Called when the current settings ara changed"""
 
+        # the save button already shows the unsaved changes (called for every keystroke in the line edits)
+        if self.unsaved_configuration:
+            return
+
         self.save_configuration_button.setText(f'{self.save_configuration_button_text} (Unsaved changes)')
+        self.unsaved_configuration = True
 
     def saveConfigView(self, simulation_check: bool = True):
         """
@@ -635,7 +759,7 @@ class ConfigurationPage(TabWithToolbar):
                 'Path to "Simulation bolder" can not be empty'
             )
 
-        elif title in [sc.title for sc in self.main_window.simulation_configs] and self.selected_configuration is None:
+        elif title in self.configurations_by_title and self.selected_configuration is None:
             showMessageBox(
                 self,
                 QMessageBox.Warning,
@@ -658,36 +782,40 @@ class ConfigurationPage(TabWithToolbar):
                 if result == QMessageBox.Abort:
                     return False
 
+            # autosave is only needed if the configurations changed
+            autosave = self.selected_configuration is None or self.unsaved_configuration
+
             if self.selected_configuration is None:
-                sc = SimulationConfiguration(title, program, folder, binary, version, base_save_folder)
-                self.main_window.simulation_configs.append(sc)
+                saved_configuration = SimulationConfiguration(title, program, folder, binary, version, base_save_folder)
+                self.main_window.simulation_configs.append(saved_configuration)
             else:
-                self.selected_configuration.edit(title, folder, binary, version, base_save_folder)
+                saved_configuration = self.selected_configuration
+                saved_configuration.edit(title, folder, binary, version, base_save_folder)
 
             # update data for new folder/binary
-            if self.selected_configuration is not None and isinstance(self.selected_configuration.tab_widget, SimulationPage):
-                self.selected_configuration.tab_widget.simulation_class.update(folder, binary, version)
-                self.selected_configuration.tab_widget.simulation_class.updateElements(folder, version)
-                self.selected_configuration.tab_widget.periodic_table_dialog.setElementData(
-                    self.selected_configuration.tab_widget.simulation_class.element_data,
-                    self.selected_configuration.tab_widget.simulation_class.element_data_default
-                )
+            # (a simulation page that is not created yet will use the new data once it is created)
+            if self.selected_configuration is not None and isinstance(self.selected_configuration.tab_widget, LazySimulationPage):
+                simulation_page = self.selected_configuration.tab_widget.simulation_page
+                if simulation_page is not None:
+                    simulation_page.simulation_class.update(folder, binary, version)
+                    simulation_page.simulation_class.updateElements(folder, version)
+                    simulation_page.periodic_table_dialog.setElementData(
+                        simulation_page.simulation_class.element_data,
+                        simulation_page.simulation_class.element_data_default
+                    )
 
-            self.save(autosave=True, no_config=not GlobalConf.keep_configurations_info)
+            if autosave:
+                self.save(autosave=True, no_config=not GlobalConf.keep_configurations_info)
 
             self.main_window.writeStatusBar('Configuration saved!')
 
             self.listConfigView()
 
-            # highlight saved item in configuration list
-            j = 0
-            for i in range(self.simulation_configuration_list.count()):
-                if self.simulation_configuration_list.item(i).text() == title:
-                    j = i
-                    break
-            self.simulation_configuration_list.setCurrentRow(j)
+            # highlight saved item in configuration list (first row is for adding a new configuration)
+            self.simulation_configuration_list.setCurrentRow(self.main_window.simulation_configs.index(saved_configuration) + 1)
 
             self.save_configuration_button.setText(self.save_configuration_button_text)
+            self.unsaved_configuration = False
 
     def deleteConfigView(self):
         """Delete configuration from self.mainWindow.simConfigs dictionary and reset configuration editor"""
@@ -704,10 +832,10 @@ class ConfigurationPage(TabWithToolbar):
                     )
                     return
             self.main_window.simulation_configs.remove(self.selected_configuration)
+            self.save(autosave=True, no_config=not GlobalConf.keep_configurations_info)
         self.selected_configuration = None
         self.layout_program.setEnabled(True)
         self.layout_versions.setEnabled(True)
-        self.save(autosave=True, no_config=not GlobalConf.keep_configurations_info)
         self.clearConfigView()
         self.listConfigView()
 
@@ -741,19 +869,28 @@ class ConfigurationPage(TabWithToolbar):
         self.description_logo.hide()
         self.description_label.setText('no description')
         self.save_configuration_button.setText(self.save_configuration_button_text)
+        self.unsaved_configuration = False
         self.getVersions()
         self.getDescription()
 
+    def programChanged(self):
+        """Called when the selected simulation program is changed"""
+
+        self.getDescription()
+        self.getVersions()
+        self.unsavedConfigView()
+        self.saveFolderChanged()
+
     def getDescription(self):
         """Tries to load description from simulation class"""
 
-        sim_list = SimulationsList()
+        sim_list = SimulationConfiguration.getSimulationsList()
         selected = self.program.getValue(text=True)
         for name, desc, logo in zip(sim_list.simulation_program_names, sim_list.simulation_program_description, sim_list.simulation_program_logo):
             if name == selected:
                 self.description_label.setText(desc.strip())
                 if logo:
-                    self.description_logo.setPixmap(QPixmap(logo).scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                    self.description_logo.setPixmap(scaledPixmap(logo, 200, 150, aspect_mode=Qt.KeepAspectRatio))
                     self.description_logo.show()
                 else:
                     self.description_logo.hide()
@@ -763,7 +900,7 @@ class ConfigurationPage(TabWithToolbar):
         """Gets list of possible versions of a simulation"""
 
         selected = self.program.getValue(text=True)
-        version_list = SimulationsList().simulation_program_versions.get(selected)
+        version_list = SimulationConfiguration.getSimulationsList().simulation_program_versions.get(selected)
 
         if not isinstance(version_list, list) or not version_list:
             self.versions.clear()
@@ -860,7 +997,7 @@ class ConfigurationPage(TabWithToolbar):
         Update save folder if other simulation is selected
         """
 
-        default_save_folder = SimulationsList().simulation_program_list[self.program.currentIndex()].SaveFolder
+        default_save_folder = SimulationConfiguration.getSimulationsList().simulation_program_list[self.program.currentIndex()].SaveFolder
         self.base_save_folder.path.setText(f'{GlobalConf.save_path}/{default_save_folder}')
 
     def tryParseSimVersion(self):
@@ -868,7 +1005,7 @@ class ConfigurationPage(TabWithToolbar):
 
         folder = self.simulation_folder.path.text()
         binary = self.simulation_binary.path.text()
-        simulation_programs = SimulationsList().simulation_program_list
+        simulation_programs = SimulationConfiguration.getSimulationsList().simulation_program_list
         version = 'unknown'
         self.detected_program = 0
 
@@ -24,10 +24,12 @@ from os import chdir
 from sys import exit
 from locale import getpreferredencoding
 from re import sub
-from subprocess import Popen, getstatusoutput
+from operator import attrgetter
+from subprocess import Popen
+from shutil import which
 
 from PyQt5.QtCore import Qt, QUrl, QDir, QFile, QFileInfo, QProcess, QTimer
-from PyQt5.QtGui import QIcon, QKeySequence, QDesktopServices
+from PyQt5.QtGui import QKeySequence, QDesktopServices, QShowEvent
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QHBoxLayout, QTabWidget, QSplitter, QVBoxLayout, QGroupBox,
     QSizePolicy, QPushButton, QListWidget, QAbstractItemView, QProgressBar,
@@ -43,7 +45,7 @@ from Utility.Layouts import TabWithToolbar, InputHBoxLayout, SpinBox, VBoxTitleL
 from Utility.Indexing import Counter
 from Utility.Dialogs import showMessageBox, selectFileDialog
 from Utility.Functions import alphanumeric, inFileList, inFileDict
-from Utility.ModifyWidget import setWidgetHighlight
+from Utility.ModifyWidget import setWidgetHighlight, cachedIcon
 
 from TableWidgets.CompTable import CompRow, CompTable, CompTableTarget
 from TableWidgets.TargetTable import TargetLayersTable
@@ -79,6 +81,9 @@ class SimulationPage(TabWithToolbar):
         ABORTED = auto()
         ERROR = auto()
 
+    # terminal used for detached simulations ('' if none was found), only looked up once
+    detached_terminal: Union[str, None] = None
+
     def __init__(self, main_window: MainWindow, simulation_configuration: SimulationConfiguration):
         """
         :param main_window: main window object
@@ -159,32 +164,32 @@ class SimulationPage(TabWithToolbar):
         #
 
         # New
-        self.action_new = self.toolbar.addAction(QIcon(':/icons/new.png'), 'New')
+        self.action_new = self.toolbar.addAction(cachedIcon(':/icons/new.png'), 'New')
         self.action_new.setToolTip('<b>Reset</b> this simulation-tab and the input fields to their default states')
         self.action_new.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_N))
         self.action_new.triggered.connect(lambda: self.resetSettings())
 
         # Open
-        self.action_open = self.toolbar.addAction(QIcon(':/icons/open.png'), 'Open')
+        self.action_open = self.toolbar.addAction(cachedIcon(':/icons/open.png'), 'Open')
         self.action_open.setToolTip('<b>Open</b> an existing simulation input setting')
         self.action_open.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_O))
         self.action_open.triggered.connect(lambda: self.loadSettings())  # self.loadSettings(from_json=False)
 
         # Import
-        self.action_import = self.toolbar.addAction(QIcon(':/icons/convert.png'), 'Convert')
+        self.action_import = self.toolbar.addAction(cachedIcon(':/icons/convert.png'), 'Convert')
         self.action_import.setToolTip('<b>Convert</b> simulation input setting')
         self.action_import.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_I))
         self.action_import.triggered.connect(lambda: self.importSettings())
 
         # Save
-        self.action_save = self.toolbar.addAction(QIcon(':/icons/save_new.png'), 'Save')
+        self.action_save = self.toolbar.addAction(cachedIcon(':/icons/save_new.png'), 'Save')
         self.action_save.setToolTip('<b>Save</b> the current settings of this simulation-tab to a simulation-tab input file')
         self.action_save.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_S))
         self.action_save.setEnabled(False)
         self.action_save.triggered.connect(lambda: self.saveSettings())
 
         # Save as
-        self.action_save_as = self.toolbar.addAction(QIcon(':/icons/save_as.png'), 'Save as')
+        self.action_save_as = self.toolbar.addAction(cachedIcon(':/icons/save_as.png'), 'Save as')
         self.action_save_as.setToolTip('<b>Save</b> the current settings of this simulation-tab under a different name and/or in a different location')
         self.action_save_as.setShortcut(QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_S))
         self.action_save_as.setEnabled(False)
@@ -194,7 +199,7 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addSeparator()
 
         # Preferences
-        self.action_preferences = self.toolbar.addAction(QIcon(':/icons/preferences.png'), 'Preferences')
+        self.action_preferences = self.toolbar.addAction(cachedIcon(':/icons/preferences.png'), 'Preferences')
         self.action_preferences.setToolTip('Open the <b>general settings</b> of this simulation configuration')
         self.action_preferences.setShortcut(QKeySequence.Preferences)
         self.action_preferences.triggered.connect(lambda: self.main_window.switchSettingsTab(self.simulation_configuration))
@@ -203,9 +208,9 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addSeparator()
 
         # Status
-        self.pixmap_ok = QIcon(':/icons/okay.png').pixmap(32)
-        self.pixmap_warning = QIcon(':/icons/warning.png').pixmap(32)
-        self.pixmap_error = QIcon(':/icons/error.png').pixmap(32)
+        self.pixmap_ok = cachedIcon(':/icons/okay.png').pixmap(32)
+        self.pixmap_warning = cachedIcon(':/icons/warning.png').pixmap(32)
+        self.pixmap_error = cachedIcon(':/icons/error.png').pixmap(32)
         self.run_status_icon = QLabel('')
         self.toolbar.addWidget(self.run_status_icon)
         self.run_status_text = QLabel('')
@@ -215,7 +220,7 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addSeparator()
 
         # Run
-        self.action_run = self.toolbar.addAction(QIcon(':/icons/play.png'), 'Run')
+        self.action_run = self.toolbar.addAction(cachedIcon(':/icons/play.png'), 'Run')
         self.action_run.setToolTip('Save the current settings and <b>run the simulation</b> on the input file')
         self.action_run.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_R))
         self.action_run.triggered.connect(lambda: self.runSimulation())
@@ -228,7 +233,7 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addWidget(self.run_progress)
 
         # Run abort
-        self.action_abort = self.toolbar.addAction(QIcon(':/icons/abort.png'), 'Abort')
+        self.action_abort = self.toolbar.addAction(cachedIcon(':/icons/abort.png'), 'Abort')
         self.action_abort.setToolTip('<b>Abort</b> the currently active simulation')
         self.action_abort.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_P))
         self.action_abort.setEnabled(False)
@@ -236,7 +241,7 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addSeparator()
 
         # Run detached
-        self.action_run_detached = self.toolbar.addAction(QIcon(':/icons/play_detached.png'), 'Run detached')
+        self.action_run_detached = self.toolbar.addAction(cachedIcon(':/icons/play_detached.png'), 'Run detached')
         self.action_run_detached.setToolTip('Save the current settings and <b>run the simulation</b> on the input file in detached mode.\nThe simulation is run in a separate window, and the GUI can be closed')
         self.action_run_detached.setShortcut(QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_R))
         self.action_run_detached.triggered.connect(lambda: self.runSimulation(detached=True))
@@ -255,12 +260,12 @@ class SimulationPage(TabWithToolbar):
         self.toolbar.addWidget(self.working_dir)
 
         # Open working directory button
-        self.open_working_dir = self.toolbar.addAction(QIcon(':/icons/open_workdir.png'), 'Open working directory')
+        self.open_working_dir = self.toolbar.addAction(cachedIcon(':/icons/open_workdir.png'), 'Open working directory')
         self.open_working_dir.setToolTip('Open the working directory in the file explorer')
         self.open_working_dir.triggered.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(self.simulation_configuration.save_folder)))
 
         # Open docs button
-        self.action_open_documentation = self.toolbar.addAction(QIcon(':/icons/book.png'), 'Simulation documentation')
+        self.action_open_documentation = self.toolbar.addAction(cachedIcon(':/icons/book.png'), 'Simulation documentation')
         self.action_open_documentation.setShortcut(QKeySequence.HelpContents)
         self.updateDocs()
         self.action_open_documentation.triggered.connect(self.openDocs)
@@ -390,7 +395,7 @@ class SimulationPage(TabWithToolbar):
 
         # Additional settings
         self.additional_settings_vbox = VBoxTitleLayout(self, 'Additional Settings', Styles.title_style, 0, False)
-        self.check_settings_button = QPushButton(QIcon(':/icons/error_check.png'), '', self)
+        self.check_settings_button = QPushButton(cachedIcon(':/icons/error_check.png'), '', self)
         self.check_settings_button.setMaximumWidth(50)
         self.check_settings_button.setToolTip('Check the settings for validity')
         self.check_settings_button.clicked.connect(lambda: self.checkAdditionalSettings())
@@ -465,11 +470,11 @@ class SimulationPage(TabWithToolbar):
         # List of output files
         self.parent_widget_output_list = QWidget(self)
         self.output_list_vbox = VBoxTitleLayout(self, 'List of files', Styles.title_style, 0, False)
-        self.refresh_output_files_button = QPushButton(QIcon(':/icons/refresh.png'), '', self)
+        self.refresh_output_files_button = QPushButton(cachedIcon(':/icons/refresh.png'), '', self)
         self.refresh_output_files_button.setMaximumWidth(50)
         self.refresh_output_files_button.setToolTip('Refresh the list')
         self.output_list_vbox.hl.addWidget(self.refresh_output_files_button)
-        self.open_output_file_button = QPushButton(QIcon(':/icons/open_external.png'), '', self)
+        self.open_output_file_button = QPushButton(cachedIcon(':/icons/open_external.png'), '', self)
         self.open_output_file_button.setMaximumWidth(50)
         self.open_output_file_button.setToolTip('Open the selected file with the standard text editor')
         self.open_output_file_button.setEnabled(False)
@@ -517,11 +522,11 @@ class SimulationPage(TabWithToolbar):
         # Available data for plotting
         self.parent_widget_plot_list = QWidget(self)
         self.plot_list_vbox = VBoxTitleLayout(self, 'Available data for plotting', Styles.title_style, 0, False)
-        self.refresh_output_parameters_button = QPushButton(QIcon(':/icons/refresh.png'), '', self)
+        self.refresh_output_parameters_button = QPushButton(cachedIcon(':/icons/refresh.png'), '', self)
         self.refresh_output_parameters_button.setMaximumWidth(50)
         self.refresh_output_parameters_button.setToolTip('Refresh the list')
         self.plot_list_vbox.hl.addWidget(self.refresh_output_parameters_button)
-        self.save_plot_button = QPushButton(QIcon(':/icons/save.png'), '', self)
+        self.save_plot_button = QPushButton(cachedIcon(':/icons/save.png'), '', self)
         self.save_plot_button.setMaximumWidth(50)
         self.save_plot_button.setToolTip('Save the data of the selected plot')
         self.save_plot_button.clicked.connect(self.savePlot)
@@ -929,18 +934,20 @@ class SimulationPage(TabWithToolbar):
                     f'konsole -p tabtitle="{self.simulation_configuration.title}" -e bash -c \'{cmd}; exec bash\'',
                     f'terminator -T {self.simulation_configuration.title} -e \'{cmd}; exec bash\''
                 ]
-                checking_cmds = [
-                    'command -v ',
-                    'type ',
-                    'hash '
-                ]
+
+                # look up the available terminal only once, without starting a shell for every check
+                if SimulationPage.detached_terminal is None:
+                    SimulationPage.detached_terminal = ''
+                    for terminal_cmd in terminal_cmds:
+                        terminal = terminal_cmd.split(' ')[0]
+                        if which(terminal) is not None:
+                            SimulationPage.detached_terminal = terminal
+                            break
 
                 for terminal_cmd in terminal_cmds:
-                    # check if command is found
-                    if any([getstatusoutput(f'{checking_cmd}{terminal_cmd.split(" ")[0]}')[0] for checking_cmd in checking_cmds]):
-                        continue
-                    Popen(terminal_cmd, shell=True)
-                    break
+                    if terminal_cmd.split(' ')[0] == SimulationPage.detached_terminal:
+                        Popen(terminal_cmd, shell=True)
+                        break
 
                 else:
                     Popen(cmd, shell=True)
@@ -1139,7 +1146,7 @@ class SimulationPage(TabWithToolbar):
 
         # fill rows in order
         if json_loaded:
-            for _, row in sorted(zip([row.index for row in arguments.beam_rows + arguments.target_rows], arguments.beam_rows + arguments.target_rows)):
+            for row in sorted(arguments.beam_rows + arguments.target_rows, key=attrgetter('index')):
                 if row in arguments.beam_rows:
                     self.table_beam.setArguments([row], arguments, element_data, False)
                 else:
@@ -1723,3 +1730,87 @@ class SimulationPage(TabWithToolbar):
             file.write(plot_data)
 
         self.main_window.writeStatusBar(f'Plot data saved as "{file_path}"')
+
+
+class LazySimulationPage(QWidget):
+    """
+    Placeholder tab for a SimulationPage, the SimulationPage is only created when the tab is shown the first time or
+    when it is needed otherwise
+
+    :param main_window: main window object
+    :param simulation_configuration: specific simulation configuration
+    """
+
+    def __init__(self, main_window: MainWindow, simulation_configuration: SimulationConfiguration):
+        super().__init__()
+
+        self.main_window = main_window
+        self.simulation_configuration = simulation_configuration
+        self.simulation_page: Union[SimulationPage, None] = None
+
+        self.layout = QVBoxLayout()
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.layout)
+
+    def page(self) -> SimulationPage:
+        """Returns the SimulationPage, creates it if it does not exist yet"""
+
+        if self.simulation_page is None:
+            self.simulation_page = SimulationPage(self.main_window, self.simulation_configuration)
+            self.layout.addWidget(self.simulation_page)
+        return self.simulation_page
+
+    def showEvent(self, event: QShowEvent):
+        """
+        Creates the SimulationPage when the tab is shown the first time
+
+        :param event: show event
+        """
+
+        self.page()
+        super().showEvent(event)
+
+    def isClosable(self) -> bool:
+        """Returns if this simulation page can be closed: no unsaved changes and no simulation running"""
+
+        if self.simulation_page is None:
+            return not (self.simulation_configuration.running or self.simulation_configuration.unsaved_changes)
+        return self.simulation_page.isClosable()
+
+    def saveSettings(self):
+        """Saves settings, if the SimulationPage was not created yet there is nothing to save"""
+
+        if self.simulation_page is not None:
+            self.simulation_page.saveSettings()
+
+    def resetSettings(self):
+        """Reset Settings to default, if the SimulationPage was not created yet only the save folder is reset"""
+
+        if self.simulation_page is not None:
+            self.simulation_page.resetSettings()
+        elif not self.simulation_configuration.running:
+            self.simulation_configuration.save_folder = ''
+
+    def loadSettings(self, path: Union[str, bool] = False):
+        """
+        Loads settings in the SimulationPage
+
+        :param path: (optional) path of folder to load settings from
+        """
+
+        self.page().loadSettings(path)
+
+    def runSimulation(self, detached: bool = False):
+        """
+        Executes the simulation of the SimulationPage
+
+        :param detached: (optional) runs in detached mode
+        """
+
+        self.page().runSimulation(detached=detached)
+
+    def killProcess(self):
+        """Kills the running simulation process, only a created SimulationPage can have a running process"""
+
+        if self.simulation_page is not None:
+            self.simulation_page.process.kill()
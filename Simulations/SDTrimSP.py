@@ -18,6 +18,7 @@
 
 from typing import List, Union, Tuple, Optional, Callable
 from itertools import zip_longest
+from operator import attrgetter
 from os import path, listdir
 from re import findall, sub
 
@@ -2119,8 +2120,8 @@ Andreas Mutzke
 
         grouped_rows = []
         if group_elements:
-            beam_rows = sorted([row for row in arguments.beam_rows if row.symbol])
-            target_rows = sorted([row for row in arguments.target_rows if row.symbol])
+            beam_rows = sorted([row for row in arguments.beam_rows if row.symbol], key=attrgetter('index'))
+            target_rows = sorted([row for row in arguments.target_rows if row.symbol], key=attrgetter('index'))
             used_beam_rows = []
 
             for target_row in target_rows:
@@ -2138,7 +2139,7 @@ Andreas Mutzke
 
         rows = arguments.beam_rows + arguments.target_rows
         rows = [row for row in rows if row.symbol]
-        rows = sorted(rows)
+        rows = sorted(rows, key=attrgetter('index'))
         mask_beam = [1 if row in arguments.beam_rows else 0 for row in rows]
 
         abundances = [round(row.abundance, 2) for row in rows]
@@ -2461,8 +2462,8 @@ text = "--- extra ---"
 
         grouped_rows = []
         if group_elements:
-            beam_rows = sorted([row for row in arguments.beam_rows if row.symbol])
-            target_rows = sorted([row for row in arguments.target_rows if row.symbol])
+            beam_rows = sorted([row for row in arguments.beam_rows if row.symbol], key=attrgetter('index'))
+            target_rows = sorted([row for row in arguments.target_rows if row.symbol], key=attrgetter('index'))
             used_beam_rows = []
 
             for target_row in target_rows:
@@ -2480,7 +2481,7 @@ text = "--- extra ---"
 
         rows = arguments.beam_rows + arguments.target_rows
         rows = [row for row in rows if row.symbol]
-        rows = sorted(rows)
+        rows = sorted(rows, key=attrgetter('index'))
 
         if group_elements:
             rows_len = len(grouped_rows)
@@ -3044,7 +3045,7 @@ class SimulationOutput(SimulationsOutput):
             self.elements.append(element)
 
         # get masses
-        self.masses = np.array([self.element_data.elementFromSymbol(element).atomic_mass for element in elements])
+        self.masses = self.element_data.atomicMasses(elements)
 
     def getElementIndex(self, element: str) -> int:
         """Returns index of element"""
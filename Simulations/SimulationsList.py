@@ -37,6 +37,7 @@ class SimulationsList:
     simulation_program_versions: Dict = {}
     simulation_evaluation_list: List[SimulationsOutput] = []
     simulation_program_names = []
+    simulation_program_indices: Dict[str, int] = {}
     simulation_program_description = []
     simulation_program_logo = []
     simulation_program_about = []
@@ -93,6 +94,7 @@ class SimulationsList:
                 else:
                     SimulationsList.simulation_program_list.append(mod.SimulationInput)
                     SimulationsList.simulation_evaluation_list.append(mod.SimulationOutput)
+                    SimulationsList.simulation_program_indices[mod.SimulationInput.Name] = len(SimulationsList.simulation_program_names)
                     SimulationsList.simulation_program_names.append(mod.SimulationInput.Name)
                     SimulationsList.simulation_program_versions[mod.SimulationInput.Name] = mod.SimulationInput.Versions
                     SimulationsList.simulation_program_description.append(mod.SimulationInput.Description)
@@ -19,6 +19,7 @@
 from typing import List, Union, Tuple, Dict, Optional, Callable
 from os import path, listdir
 from re import findall
+from operator import attrgetter
 
 import numpy as np
 
@@ -3515,7 +3516,7 @@ Wolfhard Möller
 
         rows = arguments.beam_rows + arguments.target_rows
         rows = [row for row in rows if row.symbol]
-        rows = sorted(rows)
+        rows = sorted(rows, key=attrgetter('index'))
         mask_beam = [1 if row in arguments.beam_rows else 0 for row in rows]
 
         abundances = [round(row.abundance, 2) for row in rows]
@@ -3810,7 +3811,7 @@ fout {idfout} {iddout} {idqout}{output}
 
         rows = arguments.beam_rows + arguments.target_rows
         rows = [row for row in rows if row.symbol]
-        rows = sorted(rows)
+        rows = sorted(rows, key=attrgetter('index'))
         mask_target = [0 if row in arguments.beam_rows else 1 for row in rows]
 
         layer_info_total = []
@@ -138,12 +138,13 @@ class CompoundList(QListWidget):
 
         possible_items = []
         uncheck_checkboxes = []
+        symbols = {element.symbol for element in elements}
 
         # enable and disable compounds
         for index in range(self.count()):
             item = self.item(index)
             item_widget = self.itemWidget(item)
-            state = item_widget.compound.matches(elements)
+            state = item_widget.compound.matches(symbols)
             item_widget.setDisabled(not state)
 
             if not state:
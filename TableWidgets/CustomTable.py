@@ -19,9 +19,10 @@
 from typing import List, Union
 
 from PyQt5.QtCore import pyqtSignal, QObject
-from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QTableWidget, QPushButton, QAbstractItemView, QHeaderView, QHBoxLayout, QWidget, QAbstractSpinBox
 
+from Utility.ModifyWidget import cachedIcon
+
 
 class CustomRowField:
     """
@@ -62,7 +63,7 @@ class CustomRow(QObject):
 
     def __init__(self):
         super().__init__()
-        self.remove = QPushButton(QIcon(':/icons/delete.png'), '')
+        self.remove = QPushButton(cachedIcon(':/icons/delete.png'), '')
         self.remove.setFixedSize(30, 30)
         # Center the remove button by surrounding it with two stretches inside a horizontal layout
         self.remove_button_parent = QWidget()
@@ -130,7 +131,7 @@ class CustomTable(QTableWidget):
         self.horizontal_header.setSectionResizeMode(0, QHeaderView.Fixed)
         self.horizontal_header.setMinimumSectionSize(40)
 
-        self.add_button = QPushButton(QIcon(':/icons/add.png'), '')
+        self.add_button = QPushButton(cachedIcon(':/icons/add.png'), '')
         self.add_button.setFixedSize(30, 30)
         self.add_button.clicked.connect(lambda: self.addRow())
         self.createAddButton()
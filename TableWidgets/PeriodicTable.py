@@ -477,10 +477,11 @@ class PeriodicTableDialog(QDialog):
                     selected_element = self.isotope_list.itemWidget(selected_items[0]).element
                     self.dialogFinished(selected_element)
             if self.isSearching():
+                search_result_nrs = {search_result.atomic_nr for search_result in self.search_results}
                 for widget in self.element_widgets:
                     if not widget.isEnabled():
                         continue
-                    if widget.element.atomic_nr in [search_result.atomic_nr for search_result in self.search_results]:
+                    if widget.element.atomic_nr in search_result_nrs:
                         self.setChosenElement(widget)
                         break
 
@@ -540,9 +541,11 @@ class PeriodicTableDialog(QDialog):
     def updateAllowedElements(self):
         """Update allowed elements for search"""
 
+        searching = self.isSearching()
+        search_result_nrs = {search_result.atomic_nr for search_result in self.search_results}
         for widget in self.element_widgets:
             widget.setEnabled(True)
-            if self.isSearching() and widget.element.atomic_nr not in [search_result.atomic_nr for search_result in self.search_results]:
+            if searching and widget.element.atomic_nr not in search_result_nrs:
                 widget.setEnabled(False)
                 continue
             # disable used elements without multiple isotopes
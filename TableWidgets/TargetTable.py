@@ -18,11 +18,11 @@
 
 from typing import List
 
-from PyQt5.QtGui import QRegExpValidator, QIcon
+from PyQt5.QtGui import QRegExpValidator
 from PyQt5.QtCore import pyqtSignal, QRegExp
 from PyQt5.QtWidgets import QLineEdit, QPushButton, QWidget, QHBoxLayout, QVBoxLayout
 
-from Utility.ModifyWidget import setWidgetHighlight
+from Utility.ModifyWidget import setWidgetHighlight, cachedIcon
 from Utility.Functions import limitSum
 from Utility.Layouts import SpinBox, DoubleSpinBox, SpinBoxRange
 
@@ -70,11 +70,11 @@ class TargetLayersRow(CustomRow):
         self.edit_button_hl.addWidget(self.remove)
         self.edit_button_hl.addStretch(1)
 
-        self.move_top = QPushButton(QIcon(':/icons/up.png'), '')
+        self.move_top = QPushButton(cachedIcon(':/icons/up.png'), '')
         self.move_top.setFixedSize(30, 15)
         self.move_top.setToolTip('Move this layer up')
 
-        self.move_bottom = QPushButton(QIcon(':/icons/down.png'), '')
+        self.move_bottom = QPushButton(cachedIcon(':/icons/down.png'), '')
         self.move_bottom.setFixedSize(30, 15)
         self.move_bottom.setToolTip('Move this layer down')
 
@@ -20,7 +20,7 @@ from typing import List, Union, Tuple
 from datetime import datetime
 from re import sub, findall
 
-from numpy import array, ndarray
+from numpy import array, ndarray, full
 
 
 def limitSum(objects: list, maximum: float):
@@ -78,6 +78,28 @@ def normalizeList(numbers: List[float], total: int = 1, digits: int = 5) -> List
     return numbers_return
 
 
+def normalizeArray(numbers: ndarray, total: int = 1, digits: int = 5) -> ndarray:
+    """
+    Normalizes array numbers to sum of total, same rules as normalizeList
+
+    :param numbers: array to be normalized
+    :param total: (optional) value to be normalized to
+    :param digits: (optional) max number of output digits
+
+    :return: normalized array
+    """
+
+    if not numbers.size:
+        return numbers
+    total_init = numbers.sum()
+    if not total_init:
+        return full(numbers.size, total / numbers.size)
+    numbers_return = (total * numbers / total_init).round(digits)
+    if numbers_return.size > 1:
+        numbers_return[-1] = round(total - numbers_return[:-1].sum(), digits)
+    return numbers_return
+
+
 def dateStr(fmt: str = '%a. %b %d %H:%M:%S %Y') -> str:
     """
     Returns date as string
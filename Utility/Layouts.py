@@ -1053,12 +1053,8 @@ class MplCanvasSettings:
 
     def plot(self, x, y, **kwargs):
         """Set plot data"""
-        plot_data = {
-            'x': x,
-            'y': y
-        }
-        plot_data.update(kwargs)
-        self.plot_data.append(plot_data)
+        # x and y are stored separately from the keyword arguments, so they can be passed on without modification
+        self.plot_data.append((x, y, kwargs))
 
     def set_xlabel(self, xlabel):
         """Set xlabel"""
@@ -1144,16 +1140,10 @@ class MplCanvasSettings:
 
         mpl_canvas.axes = mpl_canvas.fig.add_subplot(projection=self.projection)
 
-        for plot_data in self.plot_data:
-            # x and y need to be separated
-            x = plot_data['x']
-            y = plot_data['y']
+        for x, y, plot_kwargs in self.plot_data:
             if x is None or y is None:
                 continue
-            del plot_data['x']
-            del plot_data['y']
-
-            mpl_canvas.axes.plot(x, y, **plot_data)
+            mpl_canvas.axes.plot(x, y, **plot_kwargs)
 
         if self.xlabel is not None:
             mpl_canvas.axes.set_xlabel(self.xlabel)
@@ -16,10 +16,51 @@
 # https://www.gnu.org/licenses/.
 
 
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QIcon, QPixmap
 from PyQt5.QtWidgets import QSpinBox, QDoubleSpinBox, QWidget, QComboBox, QGraphicsDropShadowEffect, QGraphicsColorizeEffect
 
 
+# icons by file, since icons can be shared between widgets
+cached_icons = {}
+
+
+def cachedIcon(file: str) -> QIcon:
+    """
+    Returns icon of file, the icon is only loaded once
+
+    :param file: path to icon
+    """
+
+    icon = cached_icons.get(file)
+    if icon is None:
+        icon = cached_icons[file] = QIcon(file)
+    return icon
+
+
+# scaled pixmaps by (file, width, height, aspect_mode, transform_mode), since the images do not change at runtime
+scaled_pixmaps = {}
+
+
+def scaledPixmap(file: str, width: int, height: int, transform_mode: Qt.TransformationMode = Qt.SmoothTransformation,
+                 aspect_mode: Qt.AspectRatioMode = Qt.IgnoreAspectRatio) -> QPixmap:
+    """
+    Returns pixmap of image scaled to width and height, the pixmap is only scaled once
+
+    :param file: path to image
+    :param width: width of pixmap
+    :param height: height of pixmap
+    :param transform_mode: (optional) transformation mode used for scaling
+    :param aspect_mode: (optional) aspect ratio mode used for scaling
+    """
+
+    key = (file, width, height, aspect_mode, transform_mode)
+    pixmap = scaled_pixmaps.get(key)
+    if pixmap is None:
+        pixmap = scaled_pixmaps[key] = QPixmap(file).scaled(width, height, aspect_mode, transform_mode)
+    return pixmap
+
+
 def setWidgetBackground(widget: QWidget, enabled: bool, color: QColor = QColor(144, 12, 63, 255)):
     """
     Sets widget background to some color